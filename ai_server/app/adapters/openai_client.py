@@ -1,37 +1,237 @@
+import asyncio
+import hashlib
 import logging
+from functools import partial
 
+import httpx
 from openai import AsyncOpenAI
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 임베딩 API 1회 요청당 최대 입력 개수 (OpenAI 제한: 2048)
+EMBEDDING_BATCH_SIZE = 2048
+
+# 프로세스 전역 HTTP 클라이언트 (임베딩/LLM 호출이 커넥션 풀/TLS 세션 공유)
+_http_client: httpx.AsyncClient | None = None
+
+# API 키별 AsyncOpenAI 공유 (커넥션 풀/TLS 세션 재사용)
+_clients: dict[str, AsyncOpenAI] = {}
+
+# 프로세스 전역 OpenAI 동시 요청 상한 (임베딩/LLM 호출이 함께 사용)
+_request_limiter: asyncio.Semaphore | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """OpenAI 호출용 공유 httpx.AsyncClient 반환 (없으면 생성)"""
+    global _http_client
+    if _http_client is None:
+        # HTTP/2: 같은 호스트(api.openai.com)로 가는 동시 요청을 한 연결에 다중화
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _http_client
+
+
+def get_request_limiter() -> asyncio.Semaphore:
+    """
+    OpenAI 동시 요청 상한 세마포어 반환 (없으면 생성)
+
+    버스트 시 429 → SDK 재시도 지연으로 번지는 것을 막기 위해
+    임베딩과 LLM(ChatOpenAI) 호출이 같은 상한을 공유합니다.
+    """
+    global _request_limiter
+    if _request_limiter is None:
+        _request_limiter = asyncio.Semaphore(settings.openai_max_concurrency)
+    return _request_limiter
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (서버 종료 시)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _clients.clear()
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """프로세스 전역 AsyncOpenAI 반환 (없으면 생성)"""
+    client = _clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=2,
+            timeout=60.0,
+            http_client=get_http_client(),
+        )
+        _clients[api_key] = client
+    return client
+
 
 class OpenAIClient:
     """OpenAI API 클라이언트 (임베딩 전용)"""
 
     def __init__(self) -> None:
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = _get_async_client(settings.openai_api_key)
+        # 동일 텍스트 재임베딩 방지용 캐시 (key: (model, sha256(text)) → embedding)
+        self._embedding_cache = LRUCache(
+            max_size=settings.embedding_cache_size,
+            ttl=settings.embedding_cache_ttl_seconds,
+        )
+        # 진행 중인 단건 임베딩 요청 (key → 요청 태스크): 동시에 들어온 동일 텍스트 중복 호출 방지
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # 동시 요청 상한 (LLM 호출과 공유하는 프로세스 전역 세마포어)
+        self._semaphore = get_request_limiter()
+
+    async def warmup(self) -> None:
+        """
+        OpenAI API 연결 미리 열기 (TCP/TLS 핸드셰이크를 첫 요청 대신 기동 시점에 수행)
 
-    async def create_embedding(self, text: str, model: str = "text-embedding-3-small"):
+        과금 없는 모델 목록 조회를 사용하며, 실패해도 서버 기동은 계속합니다.
+        """
+        try:
+            await self._client.with_options(max_retries=0, timeout=5.0).models.list()
+            logger.info("[OpenAI] 연결 warm-up 완료")
+        except Exception as e:
+            logger.warning("[OpenAI] 연결 warm-up 실패 (첫 요청에서 재연결): %s", e)
+
+    async def create_embedding(
+        self,
+        text: str,
+        model: str = "text-embedding-3-small",
+        no_cache: bool = False,
+    ):
         """
         텍스트를 벡터 임베딩으로 변환
 
+        동일 텍스트 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유합니다.
+        (예: base_qa 저장과 RAG 검색이 동시에 같은 텍스트를 임베딩)
+
         Args:
             text: 임베딩할 텍스트
             model: 임베딩 모델 (기본값: text-embedding-3-small)
+            no_cache: True면 캐시를 조회/저장하지 않음 (민감한 텍스트용)
 
         Returns:
             OpenAI Embedding Response
         """
+        if no_cache:
+            return await self._request_embedding(text, model)
+
+        cache_key = self._cache_key(text, model)
+        cached = self._embedding_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[OpenAI Embedding] 캐시 hit - model=%s", model)
+            return self._to_response(cached, model)
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # 요청 자체는 별도 태스크로 실행: 먼저 요청한 쪽이 취소돼도 공유 중인 쪽은 결과를 받음
+            task = asyncio.ensure_future(self._request_embedding(text, model))
+            self._inflight[cache_key] = task
+            task.add_done_callback(partial(self._on_embedding_done, cache_key))
+        else:
+            logger.debug("[OpenAI Embedding] 진행 중인 동일 요청 공유 - model=%s", model)
+
+        return await asyncio.shield(task)
+
+    async def _request_embedding(self, text: str, model: str):
+        """임베딩 API 호출 (동시 요청 상한 적용)"""
         try:
-            logger.debug(f"[OpenAI Embedding] 요청 - model={model}, text_length={len(text)}")
+            logger.debug("[OpenAI Embedding] 요청 - model=%s, text_length=%s", model, len(text))
 
-            response = await self._client.embeddings.create(input=text, model=model)
+            async with self._semaphore:
+                response = await self._client.embeddings.create(input=text, model=model)
 
-            logger.debug(f"[OpenAI Embedding] 완료 - dimension={len(response.data[0].embedding)}")
+            logger.debug("[OpenAI Embedding] 완료 - dimension=%s", len(response.data[0].embedding))
             return response
 
         except Exception as e:
-            logger.error(f"[OpenAI Embedding] 실패 - error={str(e)}")
+            logger.error("[OpenAI Embedding] 실패 - error=%s", e)
+            raise
+
+    def _on_embedding_done(self, cache_key: tuple[str, str], task: asyncio.Future) -> None:
+        """진행 중 요청 정리 + 성공 시 캐시 저장"""
+        self._inflight.pop(cache_key, None)
+        if task.cancelled():
+            return
+        # 대기자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 조회
+        if task.exception() is None:
+            self._embedding_cache.set(cache_key, task.result().data[0].embedding)
+
+    async def create_embeddings(
+        self,
+        texts: list[str],
+        model: str = "text-embedding-3-small",
+        no_cache: bool = False,
+    ) -> list[list[float]]:
+        """
+        여러 텍스트를 한 번의 요청(배치)으로 임베딩
+
+        캐시에 있는 텍스트는 제외하고, 나머지만 EMBEDDING_BATCH_SIZE 단위로 요청합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            model: 임베딩 모델 (기본값: text-embedding-3-small)
+            no_cache: True면 캐시를 조회/저장하지 않음
+
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+        """
+        embeddings: list[list[float] | None] = [None] * len(texts)
+        keys = [None if no_cache else self._cache_key(text, model) for text in texts]
+
+        missing: list[int] = []
+        for i, key in enumerate(keys):
+            cached = None if key is None else self._embedding_cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                embeddings[i] = cached
+
+        try:
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                chunk = missing[start : start + EMBEDDING_BATCH_SIZE]
+                logger.debug("[OpenAI Embedding] 배치 요청 - model=%s, size=%s", model, len(chunk))
+
+                async with self._semaphore:
+                    response = await self._client.embeddings.create(
+                        input=[texts[i] for i in chunk], model=model
+                    )
+
+                for item in response.data:
+                    i = chunk[item.index]
+                    embeddings[i] = item.embedding
+                    if keys[i] is not None:
+                        self._embedding_cache.set(keys[i], item.embedding)
+
+            logger.debug(
+                "[OpenAI Embedding] 배치 완료 - total=%s, requested=%s", len(texts), len(missing)
+            )
+            return embeddings
+
+        except Exception as e:
+            logger.error("[OpenAI Embedding] 배치 실패 - error=%s", e)
             raise
+
+    @staticmethod
+    def _cache_key(text: str, model: str) -> tuple[str, str]:
+        """캐시 키 생성 (원문 대신 SHA-256 다이제스트 보관)"""
+        return model, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _to_response(embedding: list[float], model: str) -> CreateEmbeddingResponse:
+        """캐시된 임베딩을 OpenAI 응답 형태로 감싸기 (호출부 호환)"""
+        return CreateEmbeddingResponse(
+            data=[Embedding(embedding=embedding, index=0, object="embedding")],
+            model=model,
+            object="list",
+            usage=Usage(prompt_tokens=0, total_tokens=0),
+        )
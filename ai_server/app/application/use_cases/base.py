@@ -6,22 +6,37 @@ Clean Architecture 원칙:
 - Template Method 패턴 적용
 """
 
+import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
 from typing import Any, TypeVar
 
+from app.core import background
+from app.core.cache import LRUCache
 from app.core.config import settings
 from app.domain.entities.qa_document import QADocument
+from app.domain.exceptions import VectorStoreWriteError
 from app.domain.ports.question_generator_port import QuestionGeneratorPort
 from app.domain.ports.vector_store_port import VectorStorePort
 from app.domain.value_objects.question_level import QuestionLevel
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["QuestionGenerationUseCase", "RAGQuestionUseCase"]
+
 # 제네릭 타입 정의
 InputDTO = TypeVar("InputDTO")
 OutputDTO = TypeVar("OutputDTO")
 
+# 후보 n개 생성 호출 (n만 받는 callable: 생성기 메서드에 나머지 인자를 partial로 고정)
+CandidateGenerator = Callable[..., Awaitable[list[tuple[str, QuestionLevel]]]]
+
+# role_label을 찾지 못했을 때 사용하는 기본 라벨
+DEFAULT_ROLE_LABEL = "멤버"
+
 
 class QuestionGenerationUseCase(ABC):
     """
@@ -30,12 +45,17 @@ class QuestionGenerationUseCase(ABC):
     공통 기능:
     - 의존성 주입 (vector_store, question_generator)
     - 중복 질문 재생성 로직
+    - 생성 후보 캐시 (동일 입력 재요청 시 LLM 호출 생략)
+    - 이미 받은 질문 사전 필터 (정확히 같은 질문은 유사도 검색 없이 중복 처리)
 
     Template Method 패턴:
     - execute()가 전체 흐름 정의
     - 서브클래스가 특정 단계 구현
     """
 
+    # 인스턴스 속성 고정 (요청마다 생성되므로 __dict__ 생략)
+    __slots__ = ("vector_store", "question_generator", "candidate_cache", "asked_questions")
+
     # 설정값 (config에서 로드)
     MAX_REGENERATION = settings.max_regeneration
     SIMILARITY_THRESHOLD = settings.similarity_threshold
@@ -44,10 +64,20 @@ class QuestionGenerationUseCase(ABC):
         self,
         vector_store: VectorStorePort,
         question_generator: QuestionGeneratorPort,
+        candidate_cache: LRUCache | None = None,
+        asked_questions: LRUCache | None = None,
     ):
-        """의존성 주입"""
+        """
+        의존성 주입
+
+        Args:
+            candidate_cache: 질문 후보 캐시 (None이면 캐시 안 함)
+            asked_questions: 멤버별 이미 받은 질문 키 캐시 (None이면 사전 필터 안 함)
+        """
         self.vector_store = vector_store
         self.question_generator = question_generator
+        self.candidate_cache = candidate_cache
+        self.asked_questions = asked_questions
 
     async def _generate_with_retry(
         self,
@@ -66,41 +96,24 @@ class QuestionGenerationUseCase(ABC):
         Returns:
             (question, level, regeneration_count, similarity_warning)
         """
-        regeneration_count = 0
-        similarity_warning = False
-
-        for attempt in range(self.MAX_REGENERATION):
-            question, level = await self.question_generator.generate_question(
-                base_qa=base_qa,
-                rag_context=rag_context,
-            )
-            logger.info(f"[Use Case] 질문 생성 (시도 {attempt + 1}): {question[:30]}...")
-
-            # 유사도 검색
-            similarity = await self.vector_store.search_similar_questions(
-                question_text=question,
-                member_id=member_id,
-            )
-
-            # 유사도가 임계값 미만이면 성공
-            if similarity < self.SIMILARITY_THRESHOLD:
-                logger.info(f"[Use Case] 고유 질문 확인 (유사도: {similarity:.2f})")
-                break
-
-            # 마지막 시도면 경고 플래그 설정하고 탈출
-            if attempt == self.MAX_REGENERATION - 1:
-                similarity_warning = True
-                logger.warning("[Use Case] 최대 재생성 횟수 도달, 마지막 질문 사용")
-                break
-
-            # 재생성 필요 (마지막 제외)
-            regeneration_count += 1
-            logger.warning(
-                f"[Use Case] 중복 질문 감지 (유사도: {similarity:.2f}), "
-                f"재생성 {regeneration_count}/{self.MAX_REGENERATION - 1}"
-            )
-
-        return question, level, regeneration_count, similarity_warning
+        generate = partial(
+            self.question_generator.generate_questions,
+            base_qa=base_qa,
+            rag_context=rag_context,
+        )
+        cache_key = self._candidate_cache_key(
+            (base_qa.member_id, base_qa.role_label, base_qa.question, base_qa.answer),
+            rag_context,
+        )
+        self._remember_asked(
+            member_id,
+            [
+                base_qa.question,
+                *(doc.question for doc in rag_context if doc.member_id == member_id),
+            ],
+        )
+        # base_qa는 백그라운드로 저장 중이므로 저장 완료 시점과 무관하게 비교 대상에서 제외
+        return await self._generate_unique(generate, member_id, cache_key, exclude=base_qa)
 
     async def _generate_for_target_with_retry(
         self,
@@ -119,42 +132,157 @@ class QuestionGenerationUseCase(ABC):
         Returns:
             (question, level, regeneration_count, similarity_warning)
         """
-        regeneration_count = 0
-        similarity_warning = False
-
-        for attempt in range(self.MAX_REGENERATION):
-            question, level = await self.question_generator.generate_question_for_target(
-                target_member_id=member_id,
-                target_role_label=role_label,
-                context=context,
-            )
-            logger.info(f"[Use Case] 질문 생성 (시도 {attempt + 1}): {question[:30]}...")
+        generate = partial(
+            self.question_generator.generate_questions_for_target,
+            target_member_id=member_id,
+            target_role_label=role_label,
+            context=context,
+        )
+        cache_key = self._candidate_cache_key((member_id, role_label), context)
+        self._remember_asked(
+            member_id, (doc.question for doc in context if doc.member_id == member_id)
+        )
+        return await self._generate_unique(generate, member_id, cache_key)
+
+    async def _generate_unique(
+        self,
+        generate: CandidateGenerator,
+        member_id: str,
+        cache_key: tuple[str, str] | None = None,
+        exclude: QADocument | None = None,
+    ) -> tuple[str, QuestionLevel, int, bool]:
+        """
+        후보 생성 + 중복 체크 공통 루프
+
+        후보 MAX_REGENERATION개 중 기존 질문과 유사하지 않은 첫 번째 질문을 선택합니다.
+        모두 유사하면 마지막 후보를 사용하고 경고 플래그를 설정합니다.
+        regeneration_count는 선택된 후보 앞에서 버려진 후보 수입니다.
+        이미 받은 질문과 정확히 같은 후보는 유사도 1.0으로 보고 벡터 검색에서 제외합니다.
 
-            # 유사도 검색
-            similarity = await self.vector_store.search_similar_questions(
-                question_text=question,
+        Args:
+            generate: n을 받아 (question, level) 후보 목록을 반환하는 callable
+            member_id: 유사도 체크 대상 멤버 ID
+            cache_key: 후보 캐시 키 (None이면 캐시 안 함)
+            exclude: 유사도 비교에서 뺄 문서 (저장 중인 base_qa)
+
+        Returns:
+            (question, level, regeneration_count, similarity_warning)
+        """
+        threshold = self.SIMILARITY_THRESHOLD
+        candidates = await self._cached_candidates(generate, cache_key)
+
+        asked = self._asked_keys(member_id)
+        similarities = [1.0] * len(candidates)
+        unseen = [
+            i
+            for i, (question, _) in enumerate(candidates)
+            if self._question_key(question) not in asked
+        ]
+        if len(unseen) < len(candidates):
+            logger.info(
+                "[Use Case] 이미 받은 질문과 동일한 후보: %s개", len(candidates) - len(unseen)
+            )
+        if unseen:
+            searched = await self.vector_store.search_similar_questions_batch(
+                question_texts=[candidates[i][0] for i in unseen],
                 member_id=member_id,
+                exclude=exclude,
+            )
+            for i, similarity in zip(unseen, searched, strict=True):
+                similarities[i] = similarity
+
+        for index, ((question, level), similarity) in enumerate(
+            zip(candidates, similarities, strict=True)
+        ):
+            logger.info(
+                "[Use Case] 질문 후보 %s: %.30s... (유사도: %.2f)",
+                index + 1,
+                question,
+                similarity,
             )
-
             # 유사도가 임계값 미만이면 성공
-            if similarity < self.SIMILARITY_THRESHOLD:
-                logger.info(f"[Use Case] 고유 질문 확인 (유사도: {similarity:.2f})")
-                break
+            if similarity < threshold:
+                logger.info("[Use Case] 고유 질문 확인 (유사도: %.2f)", similarity)
+                # 같은 후보가 캐시에서 다시 나와도 선택되지 않도록 받은 질문으로 기록
+                self._remember_asked(member_id, [question])
+                return question, level, index, False
+
+        # 모든 후보가 중복이면 마지막 후보 사용
+        logger.warning("[Use Case] 모든 후보가 중복, 마지막 질문 사용")
+        question, level = candidates[-1]
+        self._remember_asked(member_id, [question])
+        return question, level, len(candidates) - 1, True
+
+    async def _cached_candidates(
+        self,
+        generate: CandidateGenerator,
+        cache_key: tuple[str, str] | None,
+    ) -> list[tuple[str, QuestionLevel]]:
+        """
+        질문 후보 조회 (캐시 hit 시 LLM 호출 생략)
 
-            # 마지막 시도면 경고 플래그 설정하고 탈출
-            if attempt == self.MAX_REGENERATION - 1:
-                similarity_warning = True
-                logger.warning("[Use Case] 최대 재생성 횟수 도달, 마지막 질문 사용")
-                break
+        생성기는 temperature > 0이라 같은 입력에도 매번 다른 후보를 내므로,
+        캐시 항목은 한 번만 재사용하고 제거합니다 (같은 후보 묶음이 반복 제공되지 않음).
+        이전에 선택된 질문은 받은 질문으로 기록되어 재사용 시 다른 후보가 선택됩니다.
+        캐시된 후보도 매번 유사도 체크를 거치므로, 그 사이 저장된 질문과의 중복은 걸러집니다.
+        """
+        if self.candidate_cache is None or cache_key is None:
+            return await generate(n=self.MAX_REGENERATION)
 
-            # 재생성 필요 (마지막 제외)
-            regeneration_count += 1
-            logger.warning(
-                f"[Use Case] 중복 질문 감지 (유사도: {similarity:.2f}), "
-                f"재생성 {regeneration_count}/{self.MAX_REGENERATION - 1}"
-            )
+        candidates = self.candidate_cache.pop(cache_key)
+        if candidates is not None:
+            logger.info("[Use Case] 질문 후보 캐시 hit (재사용 후 제거)")
+            return candidates
+
+        candidates = await generate(n=self.MAX_REGENERATION)
+        self.candidate_cache.set(cache_key, candidates)
+        return candidates
 
-        return question, level, regeneration_count, similarity_warning
+    def _asked_keys(self, member_id: str) -> set[bytes]:
+        """멤버가 이미 받은 질문 키 집합 (사전 필터 비활성화 시 빈 집합)"""
+        if self.asked_questions is None:
+            return set()
+        return self.asked_questions.get(member_id) or set()
+
+    def _remember_asked(self, member_id: str, questions: Iterable[str]) -> None:
+        """
+        멤버가 받은 질문 기록 (base_qa/조회된 컨텍스트에서 수집, 별도 DB 조회 없음)
+
+        집합은 캐시 항목 하나로 보관되므로 TTL이 지나면 통째로 만료됩니다.
+        """
+        if self.asked_questions is None:
+            return
+        asked = self.asked_questions.get(member_id)
+        if asked is None:
+            asked = set()
+            self.asked_questions.set(member_id, asked)
+        asked.update(self._question_key(question) for question in questions)
+
+    @staticmethod
+    def _question_key(question: str) -> bytes:
+        """질문 정규화 키: 대소문자/공백/문장부호 차이를 무시한 64비트 다이제스트"""
+        normalized = "".join(ch for ch in question.casefold() if ch.isalnum())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+
+    def _candidate_cache_key(
+        self,
+        fields: tuple[str, ...],
+        context: list[QADocument],
+    ) -> tuple[str, str]:
+        """
+        후보 캐시 키 생성: (Use Case 이름, blake2b(입력 필드 + 컨텍스트 문서 식별자))
+
+        컨텍스트에 포함된 문서가 추가/변경되면 키가 달라집니다.
+        새로 저장된 문서가 컨텍스트(top-k/최근 N개)에 들지 않으면 키는 그대로이므로,
+        재사용 횟수는 _cached_candidates에서 1회로 제한합니다.
+        """
+        doc_ids = sorted(
+            f"{doc.member_id}\x1f{doc.answered_at.isoformat()}\x1f{doc.question}" for doc in context
+        )
+        digest = hashlib.blake2b(
+            "\x1e".join((*fields, *doc_ids)).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return type(self).__name__, digest
 
     @abstractmethod
     async def execute(self, input_dto: Any) -> Any:
@@ -179,58 +307,52 @@ class RAGQuestionUseCase(QuestionGenerationUseCase):
     - _search_rag_context(): RAG 검색 방식
     """
 
+    __slots__ = ()
+
+    # 벡터 DB 저장 재시도 설정 (config에서 로드)
+    STORE_RETRY_ATTEMPTS = settings.store_retry_attempts
+    STORE_RETRY_BASE_DELAY = settings.store_retry_base_delay_seconds
+
     async def execute(self, input_dto: Any) -> Any:
         """
         RAG 기반 Use Case 실행
 
         비즈니스 플로우:
-        1. role_label 조회 (memberId로)
+        1. role_label 결정 + RAG 사전 확인 (동시 실행, 둘 다 임베딩 없는 메타데이터 조회)
         2. base_qa 생성
-        3. RAG 검색 (서브클래스 구현)
-        4. 질문 생성 + 중복 체크
-        5. 벡터 스토어 저장
+        3. RAG 검색 (서브클래스 구현, 검색할 문서가 없으면 생략)
+        4. 벡터 스토어 저장 (RAG 검색 후 백그라운드로 시작, 응답은 기다리지 않음)
+        5. 질문 생성 + 중복 체크 (저장과 동시 진행, base_qa는 중복 비교에서 제외)
         6. Output DTO 반환
         """
         log_prefix = self._get_log_prefix()
-        logger.info(f"[Use Case] {log_prefix} 시작")
+        logger.info("[Use Case] %s 시작", log_prefix)
 
-        # 1. role_label 결정
-        # - P2: API에서 role_label을 받는 경우 우선 사용
-        # - 그 외: member_id 기준 최근 질문에서 추출
-        role_label = getattr(input_dto, "role_label", None) or await self._get_role_label(
-            input_dto.member_id
+        # 1. role_label 조회와 RAG 사전 확인을 겹쳐 실행
+        #    (RAG 쿼리 임베딩에는 role_label이 포함되므로 검색 자체는 role_label 확정 후 실행)
+        role_label, has_rag_docs = await asyncio.gather(
+            self._resolve_role_label(input_dto),
+            self._has_rag_docs(input_dto),
         )
-        if not role_label:
-            logger.warning(
-                f"[Use Case] role_label을 찾을 수 없음: member_id={input_dto.member_id}, "
-                "기본값 '멤버' 사용"
-            )
-            role_label = "멤버"
 
-        # 2. Domain Entity 생성
+        # 2~3. base_qa 생성 + RAG 검색
         base_qa = self._create_base_qa(input_dto, role_label)
+        rag_context = await self._search_rag_context(input_dto, base_qa) if has_rag_docs else []
+        logger.info("[Use Case] RAG 검색 완료: %s개", len(rag_context))
 
-        # 3. RAG 검색 (서브클래스에서 구현)
-        rag_context = await self._search_rag_context(input_dto, base_qa)
-        logger.info(f"[Use Case] RAG 검색 완료: {len(rag_context)}개")
+        # 4. 저장은 검색이 끝난 뒤 시작 (base_qa가 자기 RAG 결과에 섞이지 않도록)
+        #    → 느린 LLM 호출과 겹쳐 백그라운드로 진행
+        store_task = self._spawn_store(base_qa)
 
-        # 3. 질문 생성 + 중복 체크
-        question, level, regeneration_count, similarity_warning = (
-            await self._generate_with_retry(
-                base_qa=base_qa,
-                rag_context=rag_context,
-                member_id=input_dto.member_id,
-            )
+        # 5. 질문 생성 + 중복 체크
+        question, level, regeneration_count, similarity_warning = await self._generate_with_retry(
+            base_qa=base_qa,
+            rag_context=rag_context,
+            member_id=input_dto.member_id,
         )
 
-        # 4. 저장 (다음 RAG를 위해)
-        stored = await self.vector_store.store(base_qa)
-        if not stored:
-            raise Exception("벡터 DB 저장 실패")
-        logger.info("[Use Case] 벡터 스토어 저장 완료")
-
-        # 5. Output DTO 구성
-        return self._create_output_dto(
+        # 6. Output DTO 구성 (저장 실패는 500 대신 store_status로 전달, 응답 시점 스냅샷)
+        output = self._create_output_dto(
             question=question,
             level=level,
             input_dto=input_dto,
@@ -238,6 +360,36 @@ class RAGQuestionUseCase(QuestionGenerationUseCase):
             regeneration_count=regeneration_count,
             similarity_warning=similarity_warning,
         )
+        output.metadata["store_status"] = self._store_status(store_task)
+        return output
+
+    async def _resolve_role_label(self, input_dto: Any) -> str:
+        """
+        role_label 결정: 요청값 → 최근 질문 조회 → 기본값 순
+
+        RAG 결과의 본인 문서에서 role_label을 꺼내 쓰지 않습니다.
+        RAG 쿼리 임베딩 텍스트에 role_label이 포함되어 검색 전에 확정해야 하기 때문입니다.
+        조회는 임베딩 없는 메타데이터 조회이며 RAG 사전 확인과 동시에 실행됩니다.
+
+        Args:
+            input_dto: Input DTO (role_label 속성이 있으면 우선 사용)
+
+        Returns:
+            role_label (찾지 못하면 DEFAULT_ROLE_LABEL)
+        """
+        role_label = getattr(input_dto, "role_label", None)
+        if role_label:
+            return role_label
+
+        role_label = await self._get_role_label(input_dto.member_id)
+        if not role_label:
+            logger.warning(
+                "[Use Case] role_label을 찾을 수 없음: member_id=%s, 기본값 '%s' 사용",
+                input_dto.member_id,
+                DEFAULT_ROLE_LABEL,
+            )
+            role_label = DEFAULT_ROLE_LABEL
+        return role_label
 
     async def _get_role_label(self, member_id: str) -> str | None:
         """
@@ -250,17 +402,78 @@ class RAGQuestionUseCase(QuestionGenerationUseCase):
             role_label 또는 None (찾지 못한 경우)
         """
         try:
-            recent = await self.vector_store.get_recent_questions_by_member(
-                member_id=member_id,
-                limit=1,
-            )
-            if recent:
-                return recent[0].role_label
-            return None
+            return await self.vector_store.get_role_label_by_member(member_id=member_id)
         except Exception as e:
-            logger.error(f"[Use Case] role_label 조회 실패: {e}")
+            logger.error("[Use Case] role_label 조회 실패: %s", e)
             return None
 
+    def _spawn_store(self, base_qa: QADocument) -> asyncio.Task:
+        """
+        base_qa 저장을 백그라운드로 실행 (fire-and-forget)
+
+        저장 결과는 응답에 쓰이지 않으므로 기다리지 않습니다.
+        store() 호출은 즉시 만들어 두고, 실패 시 백그라운드에서 재시도합니다.
+        """
+        return background.spawn(
+            self._store_with_retry(self.vector_store.store(base_qa), base_qa),
+            name=f"store-qa-{base_qa.member_id}",
+        )
+
+    async def _store_with_retry(self, first_attempt: Awaitable[bool], base_qa: QADocument) -> bool:
+        """
+        저장 완료 대기 + 실패 시 지수 백오프 재시도
+
+        예외는 전파하지 않고 로그만 남깁니다 (응답은 이미 반환됐거나 반환 중).
+        시도 횟수 설정이 1 미만이어도 이미 만든 첫 시도는 항상 기다립니다.
+
+        Returns:
+            최종 저장 성공 여부
+        """
+        attempts = max(1, self.STORE_RETRY_ATTEMPTS)
+        error: Exception | None = None
+        attempt = first_attempt
+        for retry in range(attempts):
+            try:
+                if not await attempt:
+                    raise VectorStoreWriteError("벡터 DB 저장 실패")
+                logger.info("[Use Case] 벡터 스토어 저장 완료")
+                return True
+            except Exception as e:
+                error = e
+
+            if retry + 1 >= attempts:
+                break
+            delay = self.STORE_RETRY_BASE_DELAY * 2**retry
+            logger.warning(
+                "[Use Case] 벡터 DB 저장 실패, %.1f초 후 재시도 (%s/%s): %s",
+                delay,
+                retry + 1,
+                attempts,
+                error,
+            )
+            await asyncio.sleep(delay)
+            attempt = self.vector_store.store(base_qa)
+
+        logger.error(
+            "[Use Case] 벡터 DB 저장 최종 실패: family_id=%s, member_id=%s, error=%s",
+            base_qa.family_id,
+            base_qa.member_id,
+            error,
+        )
+        return False
+
+    @staticmethod
+    def _store_status(task: asyncio.Task) -> str:
+        """
+        응답 시점의 저장 상태: ok | pending (진행/재시도 중) | failed
+
+        질문 생성 직후에 확인하므로 대부분 저장이 진행 중이라 "pending"입니다.
+        최종 결과가 아니며, 최종 실패는 로그(벡터 DB 저장 최종 실패)로만 확인할 수 있습니다.
+        """
+        if not task.done():
+            return "pending"
+        return "ok" if not task.cancelled() and task.result() else "failed"
+
     def _create_base_qa(self, input_dto: Any, role_label: str) -> QADocument:
         """base_qa 생성 (공통)"""
         return QADocument(
@@ -272,6 +485,14 @@ class RAGQuestionUseCase(QuestionGenerationUseCase):
             answered_at=input_dto.answered_at,
         )
 
+    async def _has_rag_docs(self, input_dto: Any) -> bool:
+        """
+        RAG 검색 대상 문서 존재 여부 (임베딩 없이 확인 가능한 경우 서브클래스에서 재정의)
+
+        False면 임베딩/검색을 생략하고 빈 컨텍스트로 진행합니다.
+        """
+        return True
+
     @abstractmethod
     async def _search_rag_context(
         self, input_dto: Any, base_qa: QADocument
@@ -23,6 +23,12 @@ class FamilyRAGQuestionUseCase(RAGQuestionUseCase):
     - top_k=10 (더 많은 맥락)
     """
 
+    __slots__ = ()
+
+    async def _has_rag_docs(self, input_dto: GenerateFamilyQuestionInput) -> bool:
+        """저장된 문서가 없는 가족은 임베딩/검색 생략 (role_label 조회와 동시 실행)"""
+        return await self.vector_store.family_has_docs(input_dto.family_id)
+
     async def _search_rag_context(
         self, input_dto: GenerateFamilyQuestionInput, base_qa: QADocument
     ) -> list[QADocument]:
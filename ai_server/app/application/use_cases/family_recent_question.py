@@ -29,6 +29,8 @@ class FamilyRecentQuestionUseCase(QuestionGenerationUseCase):
     - 벡터 DB 저장 안 함
     """
 
+    __slots__ = ()
+
     async def execute(self, input_dto: FamilyRecentQuestionInput) -> FamilyRecentQuestionOutput:
         """
         Use Case 실행
@@ -39,8 +41,9 @@ class FamilyRecentQuestionUseCase(QuestionGenerationUseCase):
         3. Output DTO 반환 (저장 없음)
         """
         logger.info(
-            f"[Use Case] 가족 최근 질문 생성 시작: "
-            f"family_id={input_dto.family_id}, target={input_dto.member_id}"
+            "[Use Case] 가족 최근 질문 생성 시작: family_id=%s, target=%s",
+            input_dto.family_id,
+            input_dto.member_id,
         )
 
         # 1. 가족 전체의 최근 질문 조회 (멤버별 3개씩)
@@ -48,13 +51,15 @@ class FamilyRecentQuestionUseCase(QuestionGenerationUseCase):
             family_id=input_dto.family_id,
             limit_per_member=3,
         )
-        logger.info(f"[Use Case] 컨텍스트 조회 완료: {len(context)}개")
+        logger.info("[Use Case] 컨텍스트 조회 완료: %s개", len(context))
 
         # 2. 타겟 멤버의 role_label 추출 (컨텍스트에서)
-        target_role_label = self._extract_role_label(context, input_dto.member_id)
+        role_by_member = self._index_role_labels(context)
+        target_role_label = role_by_member.get(input_dto.member_id)
         if not target_role_label:
             logger.warning(
-                f"[Use Case] 타겟 멤버의 role_label을 찾을 수 없음: member_id={input_dto.member_id}"
+                "[Use Case] 타겟 멤버의 role_label을 찾을 수 없음: member_id=%s",
+                input_dto.member_id,
             )
             target_role_label = "멤버"  # 기본값
 
@@ -83,18 +88,16 @@ class FamilyRecentQuestionUseCase(QuestionGenerationUseCase):
             },
         )
 
-    def _extract_role_label(self, context: list[QADocument], target_member_id: str) -> str | None:
+    def _index_role_labels(self, context: list[QADocument]) -> dict[str, str]:
         """
-        컨텍스트에서 타겟 멤버의 role_label 추출
+        컨텍스트를 한 번 순회해 member_id → role_label 인덱스 생성
+
+        컨텍스트는 멤버별 최신순이므로 멤버의 첫 문서(가장 최근) role_label을 사용합니다.
 
         Args:
             context: 가족 최근 질문 리스트
-            target_member_id: 타겟 멤버 ID
 
         Returns:
-            role_label 또는 None (찾지 못한 경우)
+            member_id → role_label 딕셔너리
         """
-        for doc in context:
-            if doc.member_id == target_member_id:
-                return doc.role_label
-        return None
+        return {doc.member_id: doc.role_label for doc in reversed(context)}
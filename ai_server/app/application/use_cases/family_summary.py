@@ -6,10 +6,12 @@
 - 응답: context만 ([특보] 스타일 헤드라인 1개)
 """
 
+import hashlib
 import logging
 from datetime import datetime, timedelta
 
 from app.application.dto.summary_dto import SummaryInput, SummaryOutput
+from app.core.cache import LRUCache
 from app.domain.entities.qa_document import QADocument
 from app.domain.ports.summary_generator_port import SummaryGeneratorPort
 from app.domain.ports.vector_store_port import VectorStorePort
@@ -27,15 +29,24 @@ class FamilySummaryUseCase:
     - vector_store.get_qa_by_family_in_range 로 기간 내 QA 조회
     - 임베딩과 동일 포맷으로 문자열화 후 LLM 요약
     - context만 반환 (메타 없음)
+    - 같은 가족/기간의 QA 구성이 그대로면 캐시된 요약 반환 (LLM 호출 생략)
     """
 
+    __slots__ = ("vector_store", "summary_generator", "summary_cache")
+
     def __init__(
         self,
         vector_store: VectorStorePort,
         summary_generator: SummaryGeneratorPort,
+        summary_cache: LRUCache | None = None,
     ):
+        """
+        Args:
+            summary_cache: 요약 캐시 (None이면 캐시 안 함)
+        """
         self.vector_store = vector_store
         self.summary_generator = summary_generator
+        self.summary_cache = summary_cache
 
     async def execute(self, input_dto: SummaryInput) -> SummaryOutput:
         days = PERIOD_DAYS.get(input_dto.period, 7)
@@ -50,20 +61,37 @@ class FamilySummaryUseCase:
             end=end,
         )
 
-        qa_texts = [_to_embedding_style(d) for d in docs]
+        # QA 텍스트는 목록으로 모아두지 않음: 캐시 키는 순회하며 해시, LLM 입력은 제너레이터로 전달
+        cache_key = None
+        if self.summary_cache is not None:
+            cache_key = self._cache_key(input_dto.family_id, period_label, docs)
+            cached = self.summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info("[Use Case] 요약 캐시 hit: family_id=%s", input_dto.family_id)
+                return SummaryOutput(context=cached)
+
         context = await self.summary_generator.generate_summary(
-            qa_texts=qa_texts,
+            qa_texts=(doc.to_embedding_text() for doc in docs),
             period_label=period_label,
             answer_count=len(docs),
         )
 
+        if cache_key is not None:
+            self.summary_cache.set(cache_key, context)
         return SummaryOutput(context=context)
 
-
-def _to_embedding_style(doc: QADocument) -> str:
-    """임베딩과 동일 포맷 (ChromaVectorStore._to_embedding_text와 동일)"""
-    y, m, d = doc.get_date_parts()
-    return (
-        f"{y}년 {m}월 {d}일에 {doc.role_label}이(가) 받은 질문: {doc.question}\n"
-        f"답변: {doc.answer}"
-    )
+    @staticmethod
+    def _cache_key(
+        family_id: str, period_label: str, docs: list[QADocument]
+    ) -> tuple[str, str, str]:
+        """
+        요약 캐시 키: (family_id, 기간 라벨, blake2b(QA 텍스트))
+
+        QA 텍스트를 하나씩 만들어 해시에 누적하므로 전체 목록을 메모리에 두지 않습니다.
+        기간 내 QA가 추가/만료되면 키가 달라지므로 별도 무효화가 필요 없습니다.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for doc in docs:
+            hasher.update(doc.to_embedding_text().encode("utf-8"))
+            hasher.update(b"\x1e")
+        return family_id, period_label, hasher.hexdigest()
@@ -23,6 +23,8 @@ class PersonalRAGQuestionUseCase(RAGQuestionUseCase):
     - top_k=5
     """
 
+    __slots__ = ()
+
     async def _search_rag_context(
         self, input_dto: GeneratePersonalQuestionInput, base_qa: QADocument
     ) -> list[QADocument]:
@@ -0,0 +1,60 @@
+"""
+백그라운드 태스크 관리 (fire-and-forget)
+
+응답에 필요 없는 후속 작업(예: 다음 RAG를 위한 벡터 DB 저장)을 요청과 분리해 실행합니다.
+- 실행 중인 태스크 참조를 보관해 GC로 중간에 사라지지 않도록 함
+- 서버 종료 시 drain()으로 남은 작업을 마무리
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 백그라운드 태스크 (완료 시 자동 제거)
+_pending: set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine[Any, Any, Any], name: str | None = None) -> asyncio.Task:
+    """
+    코루틴을 백그라운드 태스크로 실행
+
+    Args:
+        coro: 실행할 코루틴 (예외는 코루틴 안에서 처리/로깅할 것)
+        name: 태스크 이름 (디버깅용)
+
+    Returns:
+        생성된 태스크
+    """
+    task = asyncio.create_task(coro, name=name)
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return task
+
+
+async def drain(timeout: float | None = None) -> None:
+    """
+    실행 중인 백그라운드 태스크가 끝날 때까지 대기 (종료 시 flush)
+
+    Args:
+        timeout: 최대 대기 시간 (초). 초과 시 남은 태스크는 취소
+    """
+    # 다른(이미 닫힌) 이벤트 루프의 태스크는 기다릴 수 없으므로 현재 루프 것만 대상
+    loop = asyncio.get_running_loop()
+    tasks = [task for task in _pending if task.get_loop() is loop]
+    if not tasks:
+        return
+
+    logger.info("[Background] 남은 작업 %s개 대기", len(tasks))
+    done, not_done = await asyncio.wait(tasks, timeout=timeout)
+
+    for task in not_done:
+        task.cancel()
+    if not_done:
+        logger.warning("[Background] 시간 초과로 %s개 작업 취소", len(not_done))
+
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("[Background] 작업 실패: %s", task.exception())
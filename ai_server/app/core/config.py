@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +16,10 @@ class Settings(BaseSettings):
     # 서버 설정
     host: str = "127.0.0.1"  # nginx 리버스 프록시 사용 시 localhost만 리스닝
     port: int = 8000  # nginx가 80/443 포트에서 리스닝하고 8000으로 프록시
+    environment: str = "development"  # "production"이면 reload 없이 실행 (Dockerfile ENVIRONMENT)
+    # 워커 프로세스 수 (uvicorn CLI와 같은 WEB_CONCURRENCY 환경변수)
+    # ChromaDB 로컬 persist 디렉터리는 한 프로세스만 써야 하므로 기본 1
+    web_concurrency: int = 1
     # CORS: "*" 또는 쉼표 구분 origin 목록 (예: "https://api.example.com,https://app.example.com"). 운영에서는 구체적 origin 권장.
     cors_allowed_origins: str = "*"
 
@@ -29,12 +35,43 @@ class Settings(BaseSettings):
     chroma_persist_directory: str = "./data/chroma"  # 로컬 기본값 (배포 시 환경변수로 덮어씀)
     chroma_collection_name: str = "qa_history"  # 컬렉션 이름 (QA 히스토리 단일 컬렉션)
     embedding_model: str = "text-embedding-3-small"  # OpenAI 임베딩 모델
+    embedding_cache_size: int = 2048  # 임베딩 캐시 최대 항목 수 (0이면 비활성화)
+    embedding_cache_ttl_seconds: int = 3600  # 임베딩 캐시 유효 시간 (초)
+    openai_max_concurrency: int = 32  # OpenAI API 동시 요청 상한 (임베딩/LLM 호출 공유)
+    chroma_read_workers: int = 8  # ChromaDB 조회 전용 스레드 수 (쓰기는 단일 스레드)
     rag_top_k: int = 5  # RAG 검색 시 반환할 최대 결과 수 (초기 단계: 풍부한 맥락 제공)
     rag_min_answers: int = 5  # RAG 활성화를 위한 최소 답변 개수
 
     # 질문 생성 설정
     max_regeneration: int = 3  # 중복 질문 재생성 최대 시도 횟수
-    similarity_threshold: float = 0.9  # 중복 판정 유사도 임계값 (0.0 ~ 1.0)
+    question_max_tokens: int = 400  # 질문 생성 최대 출력 토큰 (응답 JSON의 question/reasoning 필드)
+    # 중복 판정 임계값: 코사인 유사도 기준 (거리 공간과 무관하게 ChromaVectorStore가 cos로 변환)
+    # 기존 l2 컬렉션은 예전 1 - 제곱거리(= 2cos - 1) ≥ 0.9 판정, 즉 cos ≥ 0.95와 동일하게 유지
+    similarity_threshold: float = 0.95
+    similarity_cache_size: int = 2048  # 중복 판정 유사도 캐시 최대 항목 수 (0이면 비활성화)
+    similarity_cache_ttl_seconds: int = 300  # 중복 판정 유사도 캐시 유효 시간 (초)
+    question_cache_size: int = 1024  # 질문 후보 캐시 최대 항목 수 (0이면 비활성화)
+    question_cache_ttl_seconds: int = 3600  # 질문 후보 캐시 유효 시간 (초)
+    summary_cache_size: int = 512  # 요약 캐시 최대 항목 수 (0이면 비활성화)
+    summary_cache_ttl_seconds: int = 3600  # 요약 캐시 유효 시간 (초)
+    asked_question_cache_size: int = 10000  # 이미 받은 질문 사전 필터 최대 멤버 수 (0이면 비활성화)
+    asked_question_cache_ttl_seconds: int = 86400  # 이미 받은 질문 사전 필터 유효 시간 (초)
+
+    # 벡터 DB 저장 설정 (백그라운드 저장 실패 시 재시도)
+    store_retry_attempts: int = 5  # 최대 시도 횟수 (첫 시도 포함, 1 미만이면 1로 처리)
+    store_retry_base_delay_seconds: float = 0.2  # 재시도 대기 기본값 (시도마다 2배)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Settings 싱글톤 반환 (.env 파싱/검증은 최초 1회만)
+
+    FastAPI Depends(get_settings)로 주입 가능하며,
+    테스트에서는 app.dependency_overrides 또는 get_settings.cache_clear()로 교체합니다.
+    """
+    return Settings()
 
 
-settings = Settings()
+# 기존 import 호환용 별칭
+settings = get_settings()
@@ -11,13 +11,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QADocument:
     """
     질문-답변 문서 (Domain Entity)
 
     불변(Immutable) 객체:
     - frozen=True로 생성 후 수정 불가
+    - slots=True로 인스턴스별 __dict__ 없음 (RAG 컨텍스트/요약 목록 메모리 절감)
     - 순수한 비즈니스 개념 표현
 
     Attributes:
@@ -45,15 +46,31 @@ class QADocument:
         """
         return self.answered_at.year, self.answered_at.month, self.answered_at.day
 
-    def is_recent(self, days: int = 30) -> bool:
+    def to_embedding_text(self) -> str:
+        """
+        임베딩/요약에 사용하는 QA 텍스트 (벡터 스토어 저장 포맷과 동일)
+
+        Returns:
+            "YYYY년 M월 D일에 {role_label}이(가) 받은 질문: ...\n답변: ..." 형식 문자열
+        """
+        answered_at = self.answered_at
+        return (
+            f"{answered_at.year}년 {answered_at.month}월 {answered_at.day}일에 "
+            f"{self.role_label}이(가) 받은 질문: {self.question}\n"
+            f"답변: {self.answer}"
+        )
+
+    def is_recent(self, days: int = 30, now: datetime | None = None) -> bool:
         """
         최근 N일 이내 답변인지 확인
 
         Args:
             days: 기준 일수 (기본값: 30일)
+            now: 기준 시각 (목록을 걸러낼 때 한 번 구해 전달, 기본값: 현재 시각)
 
         Returns:
             True if 최근 N일 이내, False otherwise
         """
-        delta = datetime.now() - self.answered_at
-        return delta <= timedelta(days=days)
+        if now is None:
+            now = datetime.now()
+        return now - self.answered_at <= timedelta(days=days)
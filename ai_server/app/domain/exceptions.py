@@ -0,0 +1,9 @@
+"""
+도메인 예외
+
+Infrastructure 구현 세부사항과 무관하게 Use Case가 처리하는 실패 유형을 정의합니다.
+"""
+
+
+class VectorStoreWriteError(Exception):
+    """벡터 스토어 저장 실패 (재시도 대상)"""
@@ -7,6 +7,7 @@ Clean Architecture - 의존성 역전 원칙:
 - Use Case는 이 인터페이스에만 의존
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from app.domain.entities.qa_document import QADocument
@@ -46,6 +47,30 @@ class QuestionGeneratorPort(ABC):
         """
         pass
 
+    async def generate_questions(
+        self,
+        base_qa: QADocument,
+        rag_context: list[QADocument],
+        n: int,
+    ) -> list[tuple[str, QuestionLevel]]:
+        """
+        파생 질문 후보 n개 생성
+
+        기본 구현은 generate_question을 n번 동시 호출합니다.
+        구현체는 한 번의 LLM 호출(n개 completion)로 재정의할 수 있습니다.
+
+        Returns:
+            (생성된 질문, 난이도) 튜플 목록
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.generate_question(base_qa=base_qa, rag_context=rag_context)
+                    for _ in range(n)
+                )
+            )
+        )
+
     @abstractmethod
     async def generate_question_for_target(
         self,
@@ -65,3 +90,31 @@ class QuestionGeneratorPort(ABC):
             (생성된 질문, 난이도) 튜플
         """
         pass
+
+    async def generate_questions_for_target(
+        self,
+        target_member_id: str,
+        target_role_label: str,
+        context: list[QADocument],
+        n: int,
+    ) -> list[tuple[str, QuestionLevel]]:
+        """
+        특정 멤버 대상 질문 후보 n개 생성
+
+        기본 구현은 generate_question_for_target을 n번 동시 호출합니다.
+
+        Returns:
+            (생성된 질문, 난이도) 튜플 목록
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.generate_question_for_target(
+                        target_member_id=target_member_id,
+                        target_role_label=target_role_label,
+                        context=context,
+                    )
+                    for _ in range(n)
+                )
+            )
+        )
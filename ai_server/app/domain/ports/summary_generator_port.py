@@ -5,6 +5,7 @@ Summary Generator Port (인터페이스)
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 
 class SummaryGeneratorPort(ABC):
@@ -17,7 +18,7 @@ class SummaryGeneratorPort(ABC):
     @abstractmethod
     async def generate_summary(
         self,
-        qa_texts: list[str],
+        qa_texts: Iterable[str],
         period_label: str,
         answer_count: int,
     ) -> str:
@@ -25,7 +26,7 @@ class SummaryGeneratorPort(ABC):
         QA 목록을 [특보] 스타일 헤드라인 요약으로 생성
 
         Args:
-            qa_texts: 임베딩과 동일 포맷의 QA 텍스트 리스트
+            qa_texts: 임베딩과 동일 포맷의 QA 텍스트 (리스트 또는 제너레이터, 1회 순회)
             period_label: "주간" 또는 "월간"
             answer_count: 해당 기간 답변 건수 (0건일 때 톤 조절용)
 
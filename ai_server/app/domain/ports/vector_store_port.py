@@ -7,6 +7,7 @@ Clean Architecture - 의존성 역전 원칙:
 - Use Case는 이 인터페이스에만 의존
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 
@@ -38,6 +39,22 @@ class VectorStorePort(ABC):
         """
         pass
 
+    async def store_many(self, docs: list[QADocument]) -> int:
+        """
+        QA 문서 일괄 저장
+
+        기본 구현은 store()를 동시에 호출합니다.
+        구현체는 임베딩/저장을 한 번에 처리하도록 재정의할 수 있습니다.
+
+        Args:
+            docs: QADocument 목록
+
+        Returns:
+            저장된 문서 수
+        """
+        results = await asyncio.gather(*(self.store(doc) for doc in docs))
+        return sum(results)
+
     @abstractmethod
     async def search_by_member(
         self,
@@ -78,6 +95,20 @@ class VectorStorePort(ABC):
         """
         pass
 
+    async def family_has_docs(self, family_id: str) -> bool:
+        """
+        가족에 저장된 QA가 하나라도 있는지 확인 (RAG 검색 생략 판단용)
+
+        기본 구현은 항상 True (검색 생략 안 함).
+
+        Args:
+            family_id: 가족 ID
+
+        Returns:
+            저장된 문서 존재 여부
+        """
+        return True
+
     @abstractmethod
     async def search_similar_questions(
         self,
@@ -96,6 +127,32 @@ class VectorStorePort(ABC):
         """
         pass
 
+    async def search_similar_questions_batch(
+        self,
+        question_texts: list[str],
+        member_id: str,
+        exclude: QADocument | None = None,
+    ) -> list[float]:
+        """
+        여러 후보 질문의 유사도를 한 번에 검색
+
+        기본 구현은 search_similar_questions를 동시 호출합니다 (exclude 미지원).
+        구현체는 임베딩/검색을 한 번의 요청으로 묶도록 재정의할 수 있습니다.
+
+        Args:
+            question_texts: 생성된 후보 질문 텍스트 목록
+            member_id: 멤버 ID
+            exclude: 유사도 비교에서 뺄 문서 (같은 요청에서 저장 중인 base_qa)
+
+        Returns:
+            입력 순서와 동일한 유사도 점수 목록 (0.0 ~ 1.0)
+        """
+        return list(
+            await asyncio.gather(
+                *(self.search_similar_questions(text, member_id) for text in question_texts)
+            )
+        )
+
     @abstractmethod
     async def get_recent_questions_by_member(
         self,
@@ -114,6 +171,22 @@ class VectorStorePort(ABC):
         """
         pass
 
+    async def get_role_label_by_member(self, member_id: str) -> str | None:
+        """
+        멤버의 최근 role_label 조회
+
+        기본 구현은 get_recent_questions_by_member(limit=1)를 사용합니다.
+        구현체는 메타데이터만 조회하도록 재정의할 수 있습니다.
+
+        Args:
+            member_id: 멤버 ID (UUID)
+
+        Returns:
+            가장 최근 문서의 role_label 또는 None (문서 없음)
+        """
+        recent = await self.get_recent_questions_by_member(member_id=member_id, limit=1)
+        return recent[0].role_label if recent else None
+
     @abstractmethod
     async def get_recent_questions_by_family(
         self,
@@ -164,3 +237,11 @@ class VectorStorePort(ABC):
             삭제된 문서 수. 0이면 해당 member_id로 저장된 문서가 없음.
         """
         pass
+
+    def close(self) -> None:
+        """
+        구현체가 보유한 리소스 정리 (서버 종료 시)
+
+        기본 구현은 아무것도 하지 않음.
+        """
+        return None
@@ -10,13 +10,14 @@ Clean Architecture 원칙:
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestionLevel:
     """
     질문 난이도 Value Object (1-4)
 
     불변 객체:
     - frozen=True로 생성 후 수정 불가
+    - slots=True로 인스턴스별 __dict__ 없음 (질문 후보마다 생성)
     - 유효성 검증 내장
 
     Level 정의:
@@ -38,7 +39,7 @@ class QuestionLevel:
         """
         안전한 생성 팩토리 메서드
 
-        파싱 실패 시 기본값(2) 반환
+        파싱 실패 시 기본값(2) 반환. 값이 4개뿐이므로 미리 만든 인스턴스를 재사용합니다.
 
         Args:
             level: 레벨 값 (int 또는 str)
@@ -48,14 +49,11 @@ class QuestionLevel:
         """
         try:
             level_int = int(level)
-            if 1 <= level_int <= 4:
-                return cls(level_int)
-            else:
-                # 범위 초과 시 기본값
-                return cls(2)
         except (ValueError, TypeError):
             # 파싱 실패 시 기본값
-            return cls(2)
+            return _LEVELS[2]
+        # 범위 초과 시 기본값
+        return _LEVELS[level_int] if 1 <= level_int <= 4 else _LEVELS[2]
 
     @property
     def description(self) -> str:
@@ -65,10 +63,11 @@ class QuestionLevel:
         Returns:
             한글 설명 문자열
         """
-        descriptions = {
-            1: "쉬움",
-            2: "보통",
-            3: "어려움",
-            4: "매우 어려움",
-        }
-        return descriptions[self.value]
+        return _DESCRIPTIONS[self.value]
+
+
+# 레벨별 설명 (인덱스 = 레벨, 0은 미사용)
+_DESCRIPTIONS = ("", "쉬움", "보통", "어려움", "매우 어려움")
+
+# from_int가 재사용하는 인스턴스 (불변이므로 공유 가능, 인덱스 = 레벨)
+_LEVELS = (None, *(QuestionLevel(level) for level in range(1, 5)))
@@ -0,0 +1,39 @@
+"""
+LLM JSON 응답 파싱 유틸리티
+
+response_format=json_object 응답은 거의 항상 그대로 파싱 가능하므로
+한 번에 파싱하고, 실패할 때만 코드펜스/앞뒤 잡음을 잘라 재시도합니다.
+"""
+
+import orjson
+
+
+def parse_json_object(content: str) -> dict:
+    """
+    LLM 응답 문자열을 JSON 객체(dict)로 파싱
+
+    Args:
+        content: LLM 응답 텍스트
+
+    Returns:
+        파싱된 dict
+
+    Raises:
+        ValueError: JSON 객체를 찾을 수 없거나 파싱 실패
+    """
+    try:
+        parsed = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # 코드펜스(```json ... ```) 등 앞뒤 잡음 제거: 첫 '{' ~ 마지막 '}'만 파싱
+        start = content.find("{")
+        end = content.rfind("}")
+        if start == -1 or end <= start:
+            raise ValueError(f"LLM 응답에서 JSON을 찾을 수 없음: {content[:100]}") from None
+        try:
+            parsed = orjson.loads(content[start : end + 1])
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"LLM 응답 JSON 파싱 실패: {e}") from None
+
+    if not isinstance(parsed, dict):
+        raise ValueError(f"LLM 응답이 JSON 객체가 아님: {type(parsed).__name__}")
+    return parsed
@@ -9,13 +9,15 @@ Clean Architecture:
 
 import logging
 
-from langchain_core.output_parsers import JsonOutputParser
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
+from app.adapters.openai_client import get_request_limiter
 from app.domain.entities.qa_document import QADocument
 from app.domain.ports.question_generator_port import QuestionGeneratorPort
 from app.domain.value_objects.question_level import QuestionLevel
+from app.infrastructure.llm.json_response import parse_json_object
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +31,27 @@ class LangchainFamilyGenerator(QuestionGeneratorPort):
     - RAG 컨텍스트에 member_id 포함
     """
 
-    def __init__(self, prompt_data: dict, model: str, temperature: float):
+    def __init__(
+        self,
+        prompt_data: dict,
+        model: str,
+        temperature: float,
+        http_client: httpx.AsyncClient | None = None,
+        max_tokens: int | None = None,
+    ):
         """
         Args:
             prompt_data: 프롬프트 데이터 (system, user)
             model: LLM 모델명
             temperature: 온도 파라미터
+            http_client: 공유 HTTP 클라이언트 (None이면 ChatOpenAI 기본 클라이언트)
+            max_tokens: completion 최대 토큰 수 (None이면 제한 없음)
         """
         self.llm = ChatOpenAI(
             model=model,
             temperature=temperature,
+            http_async_client=http_client,
+            max_tokens=max_tokens,
             model_kwargs={"response_format": {"type": "json_object"}},
         )
 
@@ -49,10 +62,9 @@ class LangchainFamilyGenerator(QuestionGeneratorPort):
             ]
         )
 
-        self.parser = JsonOutputParser()
         self.chain = self.prompt_template | self.llm
 
-        logger.info(f"[LangchainFamilyGenerator] 초기화 완료: model={model}")
+        logger.info("[LangchainFamilyGenerator] 초기화 완료: model=%s", model)
 
     async def generate_question(
         self, base_qa: QADocument, rag_context: list[QADocument]
@@ -67,51 +79,42 @@ class LangchainFamilyGenerator(QuestionGeneratorPort):
         Returns:
             (생성된 질문, 난이도) 튜플
         """
-        logger.info(f"[LangchainFamilyGenerator] 질문 생성 시작: family_id={base_qa.family_id}")
-
-        # Domain Entity → LangChain 입력 포맷 변환
-        rag_text = self._format_rag_context(rag_context)
-        base_qa_text = self._format_base_qa(base_qa)
+        logger.info("[LangchainFamilyGenerator] 질문 생성 시작: family_id=%s", base_qa.family_id)
 
         # LangChain 호출
-        response = await self.chain.ainvoke(
-            {
-                "role_label": base_qa.role_label,
-                "rag_context": rag_text,
-                "base_qa": base_qa_text,
-            }
-        )
-
-        # JSON 파싱
-        parsed = self.parser.parse(response.content)
+        async with get_request_limiter():
+            response = await self.chain.ainvoke(self._build_inputs(base_qa, rag_context))
+        question, level = self._parse_question(response.content)
 
-        # 필수 필드 검증
-        if "question" not in parsed or "level" not in parsed:
-            raise ValueError(f"LLM 응답에 필수 필드 없음: {list(parsed.keys())}")
+        logger.info("[LangchainFamilyGenerator] 질문 생성 완료: %.30s...", question)
 
-        question = parsed["question"]
-        level = QuestionLevel.from_int(parsed["level"])
+        return question, level
 
-        logger.info(f"[LangchainFamilyGenerator] 질문 생성 완료: {question[:30]}...")
+    async def generate_questions(
+        self,
+        base_qa: QADocument,
+        rag_context: list[QADocument],
+        n: int,
+    ) -> list[tuple[str, QuestionLevel]]:
+        """
+        질문 후보 n개 생성 (한 번의 LLM 호출로 n개 completion)
 
-        return question, level
+        Returns:
+            (생성된 질문, 난이도) 튜플 목록
+        """
+        logger.info("[LangchainFamilyGenerator] 질문 후보 생성 시작: n=%s", n)
+        return await self._generate_candidates(self._build_inputs(base_qa, rag_context), n)
 
     def _format_rag_context(self, docs: list[QADocument]) -> str:
         """RAG 컨텍스트 포맷팅 (가족용: member_id 포함)"""
         if not docs:
             return "과거 답변 기록이 없습니다."
 
-        lines = []
-        for idx, doc in enumerate(docs[:10], 1):  # 가족은 최대 10개
-            year, month, day = doc.get_date_parts()
-            line = (
-                f"{idx}. [{year}-{month:02d}-{day:02d}] "
-                f"{doc.role_label} - "
-                f"Q: {doc.question} / A: {doc.answer}"
-            )
-            lines.append(line)
-
-        return "\n".join(lines)
+        return "\n".join(
+            f"{idx}. [{doc.answered_at:%Y-%m-%d}] {doc.role_label} - "
+            f"Q: {doc.question} / A: {doc.answer}"
+            for idx, doc in enumerate(docs[:10], 1)  # 가족은 최대 10개
+        )
 
     def _format_base_qa(self, doc: QADocument) -> str:
         """기준 QA 포맷팅"""
@@ -133,32 +136,76 @@ class LangchainFamilyGenerator(QuestionGeneratorPort):
 
         Note: 이 메서드는 FamilyRecentQuestionUseCase에서 사용됨
         """
-        logger.info(
-            f"[LangchainFamilyGenerator] 타겟 질문 생성 시작: "
-            f"target={target_role_label}"
-        )
+        logger.info("[LangchainFamilyGenerator] 타겟 질문 생성 시작: target=%s", target_role_label)
+
+        async with get_request_limiter():
+            response = await self.chain.ainvoke(
+                self._build_target_inputs(target_role_label, context)
+            )
+        question, level = self._parse_question(response.content)
 
-        # 컨텍스트 포맷팅
-        context_text = self._format_rag_context(context)
+        logger.info("[LangchainFamilyGenerator] 타겟 질문 생성 완료: %.30s...", question)
 
-        # 기본 프롬프트로 호출 (role_label 기반)
-        response = await self.chain.ainvoke(
-            {
-                "role_label": target_role_label,
-                "rag_context": context_text,
-                "base_qa": f"**대상:** {target_role_label}에게 새로운 질문을 생성해주세요.",
-            }
+        return question, level
+
+    async def generate_questions_for_target(
+        self,
+        target_member_id: str,
+        target_role_label: str,
+        context: list[QADocument],
+        n: int,
+    ) -> list[tuple[str, QuestionLevel]]:
+        """특정 멤버 대상 질문 후보 n개 생성 (한 번의 LLM 호출로 n개 completion)"""
+        logger.info(
+            "[LangchainFamilyGenerator] 타겟 질문 후보 생성 시작: target=%s, n=%s",
+            target_role_label,
+            n,
+        )
+        return await self._generate_candidates(
+            self._build_target_inputs(target_role_label, context), n
         )
 
-        # JSON 파싱
-        parsed = self.parser.parse(response.content)
+    async def _generate_candidates(self, inputs: dict, n: int) -> list[tuple[str, QuestionLevel]]:
+        """프롬프트 1회 렌더링 + LLM 1회 호출(n개 completion) → 후보 목록"""
+        messages = await self.prompt_template.aformat_messages(**inputs)
+        async with get_request_limiter():
+            result = await self.llm.agenerate([messages], n=n)
+
+        candidates = []
+        for generation in result.generations[0]:
+            try:
+                candidates.append(self._parse_question(generation.text))
+            except ValueError as e:
+                logger.warning("[LangchainFamilyGenerator] 후보 파싱 실패: %s", e)
+
+        if not candidates:
+            raise ValueError("LLM 응답에 유효한 질문 후보 없음")
+
+        logger.info("[LangchainFamilyGenerator] 질문 후보 생성 완료: %s개", len(candidates))
+        return candidates
+
+    def _build_inputs(self, base_qa: QADocument, rag_context: list[QADocument]) -> dict:
+        """Domain Entity → LangChain 입력 포맷 변환"""
+        return {
+            "role_label": base_qa.role_label,
+            "rag_context": self._format_rag_context(rag_context),
+            "base_qa": self._format_base_qa(base_qa),
+        }
+
+    def _build_target_inputs(self, target_role_label: str, context: list[QADocument]) -> dict:
+        """타겟 질문용 입력 포맷 (role_label 기반 기본 프롬프트 사용)"""
+        return {
+            "role_label": target_role_label,
+            "rag_context": self._format_rag_context(context),
+            "base_qa": f"**대상:** {target_role_label}에게 새로운 질문을 생성해주세요.",
+        }
+
+    def _parse_question(self, content: str) -> tuple[str, QuestionLevel]:
+        """LLM 응답 → (질문, 난이도)"""
+        parsed = parse_json_object(content)
 
+        # 필수 필드 검증
         if "question" not in parsed or "level" not in parsed:
             raise ValueError(f"LLM 응답에 필수 필드 없음: {list(parsed.keys())}")
 
-        question = parsed["question"]
-        level = QuestionLevel.from_int(parsed["level"])
-
-        logger.info(f"[LangchainFamilyGenerator] 타겟 질문 생성 완료: {question[:30]}...")
-
-        return question, level
+        return parsed["question"], QuestionLevel.from_int(parsed["level"])
@@ -5,10 +5,13 @@ LangChain 기반 주간/월간 요약 생성기 (Infrastructure)
 """
 
 import logging
+from collections.abc import Iterable
 
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
+from app.adapters.openai_client import get_request_limiter
 from app.domain.ports.summary_generator_port import SummaryGeneratorPort
 
 logger = logging.getLogger(__name__)
@@ -22,10 +25,17 @@ class LangChainSummaryGenerator(SummaryGeneratorPort):
     - 출력: [특보] 스타일 헤드라인 1개 (context)
     """
 
-    def __init__(self, prompt_data: dict, model: str, temperature: float):
+    def __init__(
+        self,
+        prompt_data: dict,
+        model: str,
+        temperature: float,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.llm = ChatOpenAI(
             model=model,
             temperature=temperature,
+            http_async_client=http_client,
         )
         self.prompt_template = ChatPromptTemplate.from_messages(
             [
@@ -34,22 +44,24 @@ class LangChainSummaryGenerator(SummaryGeneratorPort):
             ]
         )
         self.chain = self.prompt_template | self.llm
-        logger.info(f"[LangChainSummaryGenerator] 초기화 완료: model={model}")
+        logger.info("[LangChainSummaryGenerator] 초기화 완료: model=%s", model)
 
     async def generate_summary(
         self,
-        qa_texts: list[str],
+        qa_texts: Iterable[str],
         period_label: str,
         answer_count: int,
     ) -> str:
-        qa_list = "\n".join(qa_texts) if qa_texts else "(없음)"
-        response = await self.chain.ainvoke(
-            {
-                "period_label": period_label,
-                "answer_count": answer_count,
-                "qa_list": qa_list,
-            }
-        )
+        # 제너레이터도 받을 수 있도록 join 결과로 빈 목록 판정
+        qa_list = "\n".join(qa_texts) or "(없음)"
+        async with get_request_limiter():
+            response = await self.chain.ainvoke(
+                {
+                    "period_label": period_label,
+                    "answer_count": answer_count,
+                    "qa_list": qa_list,
+                }
+            )
         context = (response.content or "").strip()
-        logger.info(f"[LangChainSummaryGenerator] 요약 생성 완료: {context[:50]}...")
+        logger.info("[LangChainSummaryGenerator] 요약 생성 완료: %.50s...", context)
         return context
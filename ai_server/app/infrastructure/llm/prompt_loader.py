@@ -47,5 +47,5 @@ class PromptLoader:
         if "system" not in data or "user" not in data:
             raise ValueError("프롬프트 포맷 오류: system, user 필드 필요")
 
-        logger.info(f"[PromptLoader] 로드 완료: {filename}")
+        logger.info("[PromptLoader] 로드 완료: %s", filename)
         return data
@@ -7,19 +7,60 @@ Clean Architecture:
 - ChromaDB 구체 구현 세부사항 캡슐화
 
 ChromaDB Python 클라이언트는 동기 API이므로, async 메서드 내에서는
-asyncio.to_thread()로 스레드 풀에서 실행해 이벤트 루프 블로킹을 방지함.
+전용 스레드 풀에서 실행해 이벤트 루프 블로킹을 방지함.
+- 쓰기(add/update/delete): 단일 스레드 (HNSW 인덱스 동시 쓰기 방지)
+- 조회(get/query): 별도 풀 (기본 to_thread 풀과 경합하지 않음)
 """
 
 import asyncio
+import hashlib
+import heapq
 import logging
+import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import count
 
+import numpy as np
+
+from app.core.cache import LRUCache
 from app.domain.entities.qa_document import QADocument
 from app.domain.ports.vector_store_port import VectorStorePort
 
 logger = logging.getLogger(__name__)
 
+# 컬렉션 메타데이터에 hnsw:space가 없을 때 ChromaDB 기본 거리 공간
+DEFAULT_DISTANCE_SPACE = "l2"
+
+# answered_at_ts 보정 완료 표시 (컬렉션 메타데이터 키, 설정되면 기동 시 전체 스캔 생략)
+BACKFILL_DONE_KEY = "answered_at_ts_backfilled"
+
+# 컬렉션 메타데이터의 거리 공간 사본 키
+# (collection.modify는 hnsw:space를 넘길 수 없어 수정 시 사라지므로 별도 키로 보존)
+DISTANCE_SPACE_KEY = "distance_space"
+
+# 한 번에 add/update할 문서 수 (ChromaDB 배치 상한 이하)
+CHROMA_BATCH_SIZE = 5000
+
+# 문서 ID 순번 (같은 밀리초에 저장된 같은 멤버 문서의 ID 충돌 방지: 중복 ID add는 무시됨)
+_doc_seq = count()
+
+
+def _normalize(embedding) -> list[float]:
+    """
+    임베딩 L2 정규화 (단위 벡터)
+
+    단위 벡터끼리는 내적 = 코사인 유사도이므로 "ip" 공간에서 노름 계산이 필요 없음
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return vector.tolist()
+    return (vector / norm).tolist()
+
 
 class ChromaVectorStore(VectorStorePort):
     """
@@ -32,15 +73,42 @@ class ChromaVectorStore(VectorStorePort):
     - ChromaDB 형식 → Domain Entity 변환
     """
 
-    def __init__(self, openai_client, collection):
+    def __init__(
+        self,
+        openai_client,
+        collection,
+        similarity_cache_size: int = 2048,
+        similarity_cache_ttl: float = 300,
+        read_workers: int = 8,
+    ):
         """
         Args:
             openai_client: OpenAI 클라이언트 (임베딩용)
             collection: ChromaDB Collection
+            similarity_cache_size: 유사도 캐시 최대 항목 수 (0이면 비활성화)
+            similarity_cache_ttl: 유사도 캐시 유효 시간 (초)
+            read_workers: 조회 전용 스레드 수
         """
         self.openai_client = openai_client
         self.collection = collection
-        logger.info("[ChromaVectorStore] 초기화 완료")
+        # ChromaDB 동기 호출 전용 스레드 풀 (쓰기는 직렬화)
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-write")
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=read_workers, thread_name_prefix="chroma-read"
+        )
+        # 유사도 캐시: key=(member_id, 멤버 버전, sha1(question)) → similarity
+        # 멤버 문서가 바뀌면(store/delete) 버전을 올려 이전 항목을 무효화
+        self._similarity_cache = LRUCache(max_size=similarity_cache_size, ttl=similarity_cache_ttl)
+        self._member_versions: dict[str, int] = {}
+        # 문서가 있는 것으로 확인된 family_id (store 시 추가, 확인 후에는 재조회 안 함)
+        self._known_families: set[str] = set()
+        # 거리 → 유사도 변환 방식 (컬렉션 생성 시 정해지며 이후 변경 불가)
+        metadata = getattr(collection, "metadata", None)
+        metadata = metadata if isinstance(metadata, dict) else {}
+        self._distance_space = (
+            metadata.get("hnsw:space") or metadata.get(DISTANCE_SPACE_KEY) or DEFAULT_DISTANCE_SPACE
+        )
+        logger.info("[ChromaVectorStore] 초기화 완료: space=%s", self._distance_space)
 
     async def store(self, doc: QADocument) -> bool:
         """
@@ -54,42 +122,84 @@ class ChromaVectorStore(VectorStorePort):
         """
         try:
             logger.info(
-                f"[ChromaVectorStore] 저장 시작: family_id={doc.family_id}, "
-                f"member_id={doc.member_id}"
+                "[ChromaVectorStore] 저장 시작: family_id=%s, member_id=%s",
+                doc.family_id,
+                doc.member_id,
             )
 
             # Domain Entity → 임베딩 텍스트
-            embedding_text = self._to_embedding_text(doc)
+            embedding_text = doc.to_embedding_text()
 
             # 임베딩 생성
             response = await self.openai_client.create_embedding(embedding_text)
-            embedding = response.data[0].embedding
-
-            # 메타데이터 생성
-            metadata = {
-                "family_id": doc.family_id,
-                "member_id": doc.member_id,
-                "role_label": doc.role_label,
-                "answered_at": doc.answered_at.isoformat(),
-            }
+            embedding = _normalize(response.data[0].embedding)
 
             # ChromaDB 저장 (동기 API → 스레드 풀에서 실행)
-            doc_id = f"{doc.family_id}_{doc.member_id}_{int(datetime.now().timestamp() * 1000)}"
-            await asyncio.to_thread(
+            now_ms = time.time_ns() // 1_000_000
+            doc_id = f"{doc.family_id}_{doc.member_id}_{now_ms}_{next(_doc_seq)}"
+            await self._write(
                 self.collection.add,
                 ids=[doc_id],
                 embeddings=[embedding],
                 documents=[embedding_text],
-                metadatas=[metadata],
+                metadatas=[self._to_metadata(doc)],
             )
 
-            logger.info(f"[ChromaVectorStore] 저장 완료: {doc_id}")
+            self._invalidate_member(doc.member_id)
+            self._known_families.add(doc.family_id)
+            logger.info("[ChromaVectorStore] 저장 완료: %s", doc_id)
             return True
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 저장 실패: {e}")
+            logger.error("[ChromaVectorStore] 저장 실패: %s", e)
             return False
 
+    async def store_many(self, docs: list[QADocument]) -> int:
+        """
+        여러 Domain Entity 일괄 저장 (Port 구현: 임베딩 배치 요청 + ChromaDB add 일괄 실행)
+
+        Args:
+            docs: 저장할 QADocument 목록
+
+        Returns:
+            저장된 문서 수 (중간 배치 실패 시 그 전까지 커밋된 문서 수)
+        """
+        if not docs:
+            return 0
+
+        stored = 0
+        try:
+            texts = [doc.to_embedding_text() for doc in docs]
+            embeddings = await self.openai_client.create_embeddings(texts)
+
+            now_ms = time.time_ns() // 1_000_000
+            ids = [f"{doc.family_id}_{doc.member_id}_{now_ms}_{next(_doc_seq)}" for doc in docs]
+
+            for start in range(0, len(docs), CHROMA_BATCH_SIZE):
+                end = start + CHROMA_BATCH_SIZE
+                chunk = docs[start:end]
+                await self._write(
+                    self.collection.add,
+                    ids=ids[start:end],
+                    embeddings=[_normalize(embedding) for embedding in embeddings[start:end]],
+                    documents=texts[start:end],
+                    metadatas=[self._to_metadata(doc) for doc in chunk],
+                )
+                # 커밋된 배치는 뒤 배치 실패와 무관하게 캐시 무효화/가족 등록
+                for doc in chunk:
+                    self._invalidate_member(doc.member_id)
+                    self._known_families.add(doc.family_id)
+                stored += len(chunk)
+
+            logger.info("[ChromaVectorStore] 일괄 저장 완료: %s개", stored)
+            return stored
+
+        except Exception as e:
+            logger.error(
+                "[ChromaVectorStore] 일괄 저장 실패 (%s/%s개 저장됨): %s", stored, len(docs), e
+            )
+            return stored
+
     async def search_by_member(
         self, member_id: str, query_doc: QADocument, top_k: int = 5
     ) -> list[QADocument]:
@@ -104,12 +214,12 @@ class ChromaVectorStore(VectorStorePort):
         """
         try:
             # 쿼리 임베딩 생성
-            query_text = self._to_embedding_text(query_doc)
+            query_text = query_doc.to_embedding_text()
             response = await self.openai_client.create_embedding(query_text)
-            query_embedding = response.data[0].embedding
+            query_embedding = _normalize(response.data[0].embedding)
 
             # ChromaDB 검색 (동기 API → 스레드 풀에서 실행)
-            results = await asyncio.to_thread(
+            results = await self._read(
                 self.collection.query,
                 query_embeddings=[query_embedding],
                 n_results=top_k,
@@ -121,13 +231,13 @@ class ChromaVectorStore(VectorStorePort):
             entities = self._to_domain_entities(results)
 
             logger.info(
-                f"[ChromaVectorStore] 검색 완료: member_id={member_id}, " f"결과={len(entities)}개"
+                "[ChromaVectorStore] 검색 완료: member_id=%s, 결과=%s개", member_id, len(entities)
             )
 
             return entities
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 검색 실패: {e}")
+            logger.error("[ChromaVectorStore] 검색 실패: %s", e)
             return []
 
     async def search_by_family(
@@ -135,11 +245,11 @@ class ChromaVectorStore(VectorStorePort):
     ) -> list[QADocument]:
         """가족 QA 검색 (Port 구현)"""
         try:
-            query_text = self._to_embedding_text(query_doc)
+            query_text = query_doc.to_embedding_text()
             response = await self.openai_client.create_embedding(query_text)
-            query_embedding = response.data[0].embedding
+            query_embedding = _normalize(response.data[0].embedding)
 
-            results = await asyncio.to_thread(
+            results = await self._read(
                 self.collection.query,
                 query_embeddings=[query_embedding],
                 n_results=top_k,
@@ -150,28 +260,55 @@ class ChromaVectorStore(VectorStorePort):
             entities = self._to_domain_entities(results)
 
             logger.info(
-                f"[ChromaVectorStore] 검색 완료: family_id={family_id}, " f"결과={len(entities)}개"
+                "[ChromaVectorStore] 검색 완료: family_id=%s, 결과=%s개", family_id, len(entities)
             )
 
             return entities
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 검색 실패: {e}")
+            logger.error("[ChromaVectorStore] 검색 실패: %s", e)
             return []
 
+    async def family_has_docs(self, family_id: str) -> bool:
+        """가족 문서 존재 여부 (Port 구현: 메모리 확인 → 없으면 id 1건만 조회)"""
+        if family_id in self._known_families:
+            return True
+
+        try:
+            results = await self._read(
+                self.collection.get,
+                where={"family_id": family_id},
+                limit=1,
+                include=[],
+            )
+        except Exception as e:
+            logger.error("[ChromaVectorStore] 가족 문서 존재 확인 실패: %s", e)
+            return True  # 확인 실패 시 검색은 그대로 진행
+
+        if results.get("ids"):
+            self._known_families.add(family_id)
+            return True
+        return False
+
     async def search_similar_questions(
         self,
         question_text: str,
         member_id: str,
     ) -> float:
         """생성된 질문의 유사도 검색 (Port 구현)"""
+        cache_key = self._similarity_cache_key(question_text, member_id)
+        cached = self._similarity_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[ChromaVectorStore] 유사도 캐시 hit: member_id=%s", member_id)
+            return cached
+
         try:
             # 질문 텍스트로 임베딩 생성
             response = await self.openai_client.create_embedding(question_text)
-            query_embedding = response.data[0].embedding
+            query_embedding = _normalize(response.data[0].embedding)
 
             # ChromaDB 검색 (유사도 포함, 동기 API → 스레드 풀에서 실행)
-            results = await asyncio.to_thread(
+            results = await self._read(
                 self.collection.query,
                 query_embeddings=[query_embedding],
                 n_results=1,
@@ -181,24 +318,84 @@ class ChromaVectorStore(VectorStorePort):
 
             # 결과가 없으면 유사도 0
             if not results["ids"] or not results["ids"][0]:
+                self._similarity_cache.set(cache_key, 0.0)
                 return 0.0
 
-            # ChromaDB distance → similarity 변환 (코사인 거리)
-            # distance = 1 - similarity, so similarity = 1 - distance
-            distance = results["distances"][0][0]
-            similarity = 1 - distance
+            # ChromaDB distance → similarity 변환
+            similarity = self._to_similarity(results["distances"][0][0])
 
             logger.info(
-                f"[ChromaVectorStore] 유사도 검색: question={question_text[:30]}..., "
-                f"similarity={similarity:.2f}"
+                "[ChromaVectorStore] 유사도 검색: question=%.30s..., similarity=%.2f",
+                question_text,
+                similarity,
             )
 
+            self._similarity_cache.set(cache_key, similarity)
             return similarity
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 유사도 검색 실패: {e}")
+            logger.error("[ChromaVectorStore] 유사도 검색 실패: %s", e)
             return 0.0
 
+    async def search_similar_questions_batch(
+        self,
+        question_texts: list[str],
+        member_id: str,
+        exclude: QADocument | None = None,
+    ) -> list[float]:
+        """
+        후보 질문 유사도 일괄 검색 (Port 구현: 임베딩 1회 + ChromaDB 쿼리 1회)
+
+        exclude가 있으면 상위 2개를 조회해 exclude 문서를 건너뛴 최근접 거리를 사용합니다.
+        (백그라운드 저장이 먼저 끝났는지와 관계없이 같은 결과)
+        """
+        keys = [self._similarity_cache_key(text, member_id, exclude) for text in question_texts]
+        similarities: list[float | None] = [self._similarity_cache.get(key) for key in keys]
+        missing = [i for i, similarity in enumerate(similarities) if similarity is None]
+        if not missing:
+            return similarities
+
+        try:
+            embeddings = await self.openai_client.create_embeddings(
+                [question_texts[i] for i in missing]
+            )
+            embeddings = [_normalize(embedding) for embedding in embeddings]
+
+            results = await self._read(
+                self.collection.query,
+                query_embeddings=embeddings,
+                n_results=1 if exclude is None else 2,
+                where={"member_id": member_id},
+                include=["distances"] if exclude is None else ["distances", "metadatas"],
+            )
+
+            distances = results.get("distances") or []
+            metadatas = results.get("metadatas") or []
+            for row, i in enumerate(missing):
+                row_distances = distances[row] if row < len(distances) else []
+                if exclude is not None:
+                    row_distances = [
+                        distance
+                        for distance, metadata in zip(row_distances, metadatas[row], strict=True)
+                        if not self._is_document(metadata, exclude)
+                    ]
+                # ChromaDB distance → similarity 변환 (결과 없으면 유사도 0)
+                similarity = self._to_similarity(row_distances[0]) if row_distances else 0.0
+                similarities[i] = similarity
+                self._similarity_cache.set(keys[i], similarity)
+
+            logger.info(
+                "[ChromaVectorStore] 유사도 일괄 검색: member_id=%s, 후보=%s개, 검색=%s개",
+                member_id,
+                len(question_texts),
+                len(missing),
+            )
+            return similarities
+
+        except Exception as e:
+            logger.error("[ChromaVectorStore] 유사도 일괄 검색 실패: %s", e)
+            return [0.0 if similarity is None else similarity for similarity in similarities]
+
     async def get_recent_questions_by_member(
         self,
         member_id: str,
@@ -215,51 +412,54 @@ class ChromaVectorStore(VectorStorePort):
             최근 QADocument 리스트 (answered_at 내림차순)
         """
         try:
-            # ChromaDB에서 해당 멤버의 모든 문서 조회 (동기 API → 스레드 풀에서 실행)
-            # Note: ChromaDB는 메타데이터 정렬을 지원하지 않으므로 Python에서 정렬
-            results = await asyncio.to_thread(
+            # ChromaDB는 메타데이터 정렬을 지원하지 않으므로 메타데이터를 조회해 상위 N개 선택
+            # (메타데이터에 질문/답변 원문이 있으므로 선택된 항목을 바로 Entity로 변환)
+            results = await self._read(
                 self.collection.get,
                 where={"member_id": member_id},
-                include=["documents", "metadatas"],
+                include=["metadatas"],
             )
 
             if not results["ids"]:
-                logger.info(f"[ChromaVectorStore] 최근 질문 조회: member_id={member_id}, 결과=0개")
+                logger.info("[ChromaVectorStore] 최근 질문 조회: member_id=%s, 결과=0개", member_id)
                 return []
 
-            # Domain Entity 변환
-            entities = []
-            for i in range(len(results["ids"])):
-                metadata = results["metadatas"][i]
-                document = results["documents"][i]
-
-                question, answer = self._parse_embedding_text(document)
-
-                entity = QADocument(
-                    family_id=metadata["family_id"],
-                    member_id=metadata["member_id"],
-                    role_label=metadata["role_label"],
-                    question=question,
-                    answer=answer,
-                    answered_at=datetime.fromisoformat(metadata["answered_at"]),
-                )
-                entities.append(entity)
-
-            # answered_at 기준 내림차순 정렬 후 limit 적용
-            entities.sort(key=lambda x: x.answered_at, reverse=True)
-            recent_entities = entities[:limit]
+            recent = self._latest(results["ids"], results["metadatas"], limit)
+            recent_entities = await self._to_entities_from_metadatas(recent)
 
             logger.info(
-                f"[ChromaVectorStore] 최근 질문 조회: member_id={member_id}, "
-                f"전체={len(entities)}개, 반환={len(recent_entities)}개"
+                "[ChromaVectorStore] 최근 질문 조회: member_id=%s, 전체=%s개, 반환=%s개",
+                member_id,
+                len(results["ids"]),
+                len(recent_entities),
             )
 
             return recent_entities
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 최근 질문 조회 실패: {e}")
+            logger.error("[ChromaVectorStore] 최근 질문 조회 실패: %s", e)
             return []
 
+    async def get_role_label_by_member(self, member_id: str) -> str | None:
+        """멤버의 최근 role_label 조회 (Port 구현: 임베딩/문서 본문 없이 메타데이터 조회)"""
+        try:
+            results = await self._read(
+                self.collection.get,
+                where={"member_id": member_id},
+                include=["metadatas"],
+            )
+
+            metadatas = results["metadatas"]
+            if not metadatas:
+                return None
+
+            latest = max(metadatas, key=self._answered_at_ts)
+            return latest["role_label"]
+
+        except Exception as e:
+            logger.error("[ChromaVectorStore] role_label 조회 실패: %s", e)
+            return None
+
     async def get_recent_questions_by_family(
         self,
         family_id: str,
@@ -273,61 +473,46 @@ class ChromaVectorStore(VectorStorePort):
             limit_per_member: 멤버당 최대 질문 수 (기본값: 3)
 
         Returns:
-            최근 QADocument 리스트 (각 멤버별 limit_per_member개)
+            최근 QADocument 리스트 (멤버별로 묶여 있고, 멤버 안에서는 answered_at 내림차순)
         """
         try:
-            # ChromaDB에서 해당 가족의 모든 문서 조회 (동기 API → 스레드 풀에서 실행)
-            results = await asyncio.to_thread(
+            # 메타데이터를 조회해 멤버별 상위 N개 선택 (동기 API → 스레드 풀에서 실행)
+            results = await self._read(
                 self.collection.get,
                 where={"family_id": family_id},
-                include=["documents", "metadatas"],
+                include=["metadatas"],
             )
 
             if not results["ids"]:
                 logger.info(
-                    f"[ChromaVectorStore] 가족 최근 질문 조회: family_id={family_id}, 결과=0개"
+                    "[ChromaVectorStore] 가족 최근 질문 조회: family_id=%s, 결과=0개", family_id
                 )
                 return []
 
-            # Domain Entity 변환
-            all_entities: list[QADocument] = []
-            for i in range(len(results["ids"])):
-                metadata = results["metadatas"][i]
-                document = results["documents"][i]
-
-                question, answer = self._parse_embedding_text(document)
-
-                entity = QADocument(
-                    family_id=metadata["family_id"],
-                    member_id=metadata["member_id"],
-                    role_label=metadata["role_label"],
-                    question=question,
-                    answer=answer,
-                    answered_at=datetime.fromisoformat(metadata["answered_at"]),
-                )
-                all_entities.append(entity)
+            # 멤버별로 그룹화 후 각각 최근 N개씩 선택
+            member_groups: dict[str, tuple[list[str], list[dict]]] = defaultdict(lambda: ([], []))
+            for doc_id, metadata in zip(results["ids"], results["metadatas"], strict=True):
+                ids, metadatas = member_groups[metadata["member_id"]]
+                ids.append(doc_id)
+                metadatas.append(metadata)
 
-            # 멤버별로 그룹화 후 각각 최근 N개씩 추출
-            member_groups: dict[str, list[QADocument]] = defaultdict(list)
-            for entity in all_entities:
-                member_groups[entity.member_id].append(entity)
+            recent: list[tuple[str, dict]] = []
+            for ids, metadatas in member_groups.values():
+                recent.extend(self._latest(ids, metadatas, limit_per_member))
 
-            # 각 멤버별 최근 N개 추출
-            recent_entities: list[QADocument] = []
-            for _member_id, entities in member_groups.items():
-                # 시간순 내림차순 정렬
-                entities.sort(key=lambda x: x.answered_at, reverse=True)
-                recent_entities.extend(entities[:limit_per_member])
+            recent_entities = await self._to_entities_from_metadatas(recent)
 
             logger.info(
-                f"[ChromaVectorStore] 가족 최근 질문 조회: family_id={family_id}, "
-                f"멤버={len(member_groups)}명, 반환={len(recent_entities)}개"
+                "[ChromaVectorStore] 가족 최근 질문 조회: family_id=%s, 멤버=%s명, 반환=%s개",
+                family_id,
+                len(member_groups),
+                len(recent_entities),
             )
 
             return recent_entities
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 가족 최근 질문 조회 실패: {e}")
+            logger.error("[ChromaVectorStore] 가족 최근 질문 조회 실패: %s", e)
             return []
 
     async def get_qa_by_family_in_range(
@@ -339,50 +524,84 @@ class ChromaVectorStore(VectorStorePort):
         """
         가족 QA를 기간으로 조회 (주간/월간 요약용)
 
-        ChromaDB는 메타데이터 범위 쿼리를 지원하지 않으므로
-        family_id로 전체 조회 후 Python에서 answered_at 필터링.
+        기간 조건은 숫자 메타데이터(answered_at_ts) 범위 필터로 ChromaDB에서 처리합니다.
         """
         try:
-            # ChromaDB 기간 조회 (동기 API → 스레드 풀에서 실행)
-            results = await asyncio.to_thread(
-                self.collection.get,
-                where={"family_id": family_id},
-                include=["documents", "metadatas"],
-            )
-
-            if not results["ids"]:
-                logger.info(f"[ChromaVectorStore] 기간 조회: family_id={family_id}, 결과=0개")
-                return []
-
-            entities: list[QADocument] = []
-            for i in range(len(results["ids"])):
-                metadata = results["metadatas"][i]
-                document = results["documents"][i]
-                question, answer = self._parse_embedding_text(document)
-                answered_at = datetime.fromisoformat(metadata["answered_at"])
-                if start <= answered_at <= end:
-                    entities.append(
-                        QADocument(
-                            family_id=metadata["family_id"],
-                            member_id=metadata["member_id"],
-                            role_label=metadata["role_label"],
-                            question=question,
-                            answer=answer,
-                            answered_at=answered_at,
-                        )
-                    )
+            where = {
+                "$and": [
+                    {"family_id": family_id},
+                    {"answered_at_ts": {"$gte": start.timestamp()}},
+                    {"answered_at_ts": {"$lte": end.timestamp()}},
+                ]
+            }
+            entities = await self._get_entities(where=where)
 
             entities.sort(key=lambda x: x.answered_at)
             logger.info(
-                f"[ChromaVectorStore] 기간 조회: family_id={family_id}, "
-                f"[{start.date()}~{end.date()}], 반환={len(entities)}개"
+                "[ChromaVectorStore] 기간 조회: family_id=%s, [%s~%s], 반환=%s개",
+                family_id,
+                start.date(),
+                end.date(),
+                len(entities),
             )
             return entities
 
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] 기간 조회 실패: {e}")
+            logger.error("[ChromaVectorStore] 기간 조회 실패: %s", e)
             return []
 
+    def backfill_answered_at_ts(self) -> int:
+        """
+        answered_at_ts 메타데이터가 없는 기존 문서 보정 (기동 시, 동기)
+
+        기간 조회가 answered_at_ts 범위 필터를 사용하므로,
+        이전 버전에서 저장된 문서에 값을 채웁니다.
+        완료 후 컬렉션 메타데이터에 BACKFILL_DONE_KEY를 기록해 이후 기동에서는 스캔하지 않습니다.
+        answered_at을 해석할 수 없는 문서는 로그만 남기고 건너뜁니다.
+
+        Returns:
+            보정한 문서 수
+        """
+        collection_metadata = dict(self.collection.metadata or {})
+        if collection_metadata.get(BACKFILL_DONE_KEY):
+            return 0
+
+        results = self.collection.get(include=["metadatas"])
+        missing = []
+        for doc_id, metadata in zip(results["ids"], results["metadatas"], strict=True):
+            if "answered_at_ts" in metadata:
+                continue
+            try:
+                answered_at_ts = self._answered_at_ts(metadata)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(
+                    "[ChromaVectorStore] answered_at_ts 보정 건너뜀: id=%s, answered_at=%r (%s)",
+                    doc_id,
+                    metadata.get("answered_at"),
+                    e,
+                )
+                continue
+            missing.append((doc_id, {**metadata, "answered_at_ts": answered_at_ts}))
+
+        for start in range(0, len(missing), CHROMA_BATCH_SIZE):
+            chunk = missing[start : start + CHROMA_BATCH_SIZE]
+            self.collection.update(
+                ids=[doc_id for doc_id, _ in chunk],
+                metadatas=[metadata for _, metadata in chunk],
+            )
+
+        # modify는 메타데이터 전체를 교체하며 hnsw:* 키는 받지 않음 → 거리 공간은 사본 키로 보존
+        self.collection.modify(
+            metadata={
+                **{k: v for k, v in collection_metadata.items() if not k.startswith("hnsw:")},
+                DISTANCE_SPACE_KEY: self._distance_space,
+                BACKFILL_DONE_KEY: True,
+            }
+        )
+        if missing:
+            logger.info("[ChromaVectorStore] answered_at_ts 보정 완료: %s개", len(missing))
+        return len(missing)
+
     async def delete_by_member(self, member_id: str) -> int:
         """
         해당 멤버의 ChromaDB 이력 전부 삭제 (방법 A: get → delete by ids).
@@ -394,68 +613,185 @@ class ChromaVectorStore(VectorStorePort):
             삭제된 문서 수. 0이면 해당 member_id로 저장된 문서가 없음.
         """
         try:
-            # 해당 멤버 문서 id만 조회 (본문 불필요)
-            results = await asyncio.to_thread(
+            # 해당 멤버 문서 id + 메타데이터 조회 (family_id 확인용, 임베딩/본문 불필요)
+            results = await self._read(
                 self.collection.get,
                 where={"member_id": member_id},
-                include=[],
+                include=["metadatas"],
             )
             ids = results.get("ids") or []
             if not ids:
-                logger.info(f"[ChromaVectorStore] 삭제 대상 없음: member_id={member_id}")
+                logger.info("[ChromaVectorStore] 삭제 대상 없음: member_id=%s", member_id)
                 return 0
-            await asyncio.to_thread(self.collection.delete, ids=ids)
+            await self._write(self.collection.delete, ids=ids)
+            self._invalidate_member(member_id)
+            # 가족의 마지막 문서였을 수 있으므로 다음 family_has_docs에서 다시 확인
+            self._known_families.difference_update(
+                metadata["family_id"] for metadata in results["metadatas"]
+            )
             logger.info(
-                f"[ChromaVectorStore] 멤버 이력 삭제 완료: member_id={member_id}, "
-                f"삭제={len(ids)}개"
+                "[ChromaVectorStore] 멤버 이력 삭제 완료: member_id=%s, 삭제=%s개",
+                member_id,
+                len(ids),
             )
             return len(ids)
         except Exception as e:
-            logger.error(f"[ChromaVectorStore] delete_by_member 실패: {e}", exc_info=True)
+            logger.error("[ChromaVectorStore] delete_by_member 실패: %s", e, exc_info=True)
             raise
 
+    def close(self) -> None:
+        """
+        스레드 풀 종료 (진행 중인 ChromaDB 호출은 끝까지 대기)
+
+        블로킹 호출이므로 이벤트 루프에서는 asyncio.to_thread로 실행합니다.
+        """
+        self._write_executor.shutdown(wait=True)
+        self._read_executor.shutdown(wait=True)
+
     # === Private: Infrastructure 세부사항 ===
 
-    def _to_embedding_text(self, doc: QADocument) -> str:
-        """Domain Entity → 임베딩 텍스트"""
-        year, month, day = doc.get_date_parts()
+    async def _read(self, fn, **kwargs):
+        """ChromaDB 조회 호출을 조회 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, partial(fn, **kwargs))
+
+    async def _write(self, fn, **kwargs):
+        """ChromaDB 쓰기 호출을 단일 쓰기 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, partial(fn, **kwargs))
+
+    def _similarity_cache_key(
+        self, question_text: str, member_id: str, exclude: QADocument | None = None
+    ) -> tuple:
+        """유사도 캐시 키 (멤버 문서 버전 + 제외 문서 포함)"""
+        digest = hashlib.sha1(question_text.encode("utf-8")).hexdigest()
+        excluded = None if exclude is None else (exclude.question, exclude.answered_at)
+        return member_id, self._member_versions.get(member_id, 0), digest, excluded
+
+    @staticmethod
+    def _is_document(metadata: dict, doc: QADocument) -> bool:
+        """메타데이터가 doc과 같은 QA인지 (같은 멤버의 같은 질문, 같은 답변 시각)"""
         return (
-            f"{year}년 {month}월 {day}일에 {doc.role_label}이(가) 받은 질문: {doc.question}\n"
-            f"답변: {doc.answer}"
+            metadata.get("member_id") == doc.member_id
+            and metadata.get("question") == doc.question
+            and metadata.get("answered_at") == doc.answered_at.isoformat()
         )
 
-    def _to_domain_entities(self, results: dict) -> list[QADocument]:
-        """ChromaDB 결과 → Domain Entity 리스트"""
-        entities = []
-
-        if results["ids"] and len(results["ids"][0]) > 0:
-            for i in range(len(results["ids"][0])):
-                metadata = results["metadatas"][0][i]
-                document = results["documents"][0][i]
-
-                # 임베딩 텍스트 파싱
-                question, answer = self._parse_embedding_text(document)
-
-                entity = QADocument(
-                    family_id=metadata["family_id"],
-                    member_id=metadata["member_id"],
-                    role_label=metadata["role_label"],
-                    question=question,
-                    answer=answer,
-                    answered_at=datetime.fromisoformat(metadata["answered_at"]),
-                )
-                entities.append(entity)
+    def _invalidate_member(self, member_id: str) -> None:
+        """멤버 문서 변경 시 해당 멤버의 유사도 캐시 무효화"""
+        self._member_versions[member_id] = self._member_versions.get(member_id, 0) + 1
 
-        return entities
+    def _to_similarity(self, distance: float) -> float:
+        """
+        ChromaDB distance → 코사인 유사도 (정규화된 벡터 기준)
 
-    def _parse_embedding_text(self, text: str) -> tuple[str, str]:
-        """임베딩 텍스트 파싱 → (질문, 답변)"""
-        try:
-            if "받은 질문:" in text and "\n답변:" in text:
-                question_part = text.split("받은 질문:")[1]
-                question, answer = question_part.split("\n답변:")
-                return question.strip(), answer.strip()
-        except Exception as e:
-            logger.warning(f"[파싱 실패] {e}")
+        - ip/cosine: distance = 1 - cos
+        - l2: distance = 제곱 L2 거리 = 2 - 2cos
+        """
+        if self._distance_space == "l2":
+            return 1 - distance / 2
+        return 1 - distance
+
+    @staticmethod
+    def _to_metadata(doc: QADocument) -> dict:
+        """Domain Entity → ChromaDB 메타데이터"""
+        return {
+            "family_id": doc.family_id,
+            "member_id": doc.member_id,
+            "role_label": doc.role_label,
+            # 조회 시 임베딩 텍스트를 다시 파싱하지 않도록 원문 보관
+            "question": doc.question,
+            "answer": doc.answer,
+            "answered_at": doc.answered_at.isoformat(),
+            # 기간 조회용 숫자 값 (ChromaDB 범위 연산자는 int/float만 지원)
+            "answered_at_ts": doc.answered_at.timestamp(),
+        }
+
+    @staticmethod
+    def _answered_at_ts(metadata: dict) -> float:
+        """answered_at 타임스탬프 (answered_at_ts가 없는 기존 문서는 ISO 문자열에서 계산)"""
+        ts = metadata.get("answered_at_ts")
+        if ts is None:
+            ts = datetime.fromisoformat(metadata["answered_at"]).timestamp()
+        return ts
+
+    def _latest(self, ids: list[str], metadatas: list[dict], limit: int) -> list[tuple[str, dict]]:
+        """answered_at 내림차순 상위 limit개 (문서 ID, 메타데이터) (메타데이터만으로 선택)"""
+        # nlargest: 전체 정렬(O(N log N)) 대신 크기 limit 힙(O(N log k))
+        return heapq.nlargest(
+            limit,
+            zip(ids, metadatas, strict=True),
+            key=lambda item: self._answered_at_ts(item[1]),
+        )
+
+    async def _to_entities_from_metadatas(self, items: list[tuple[str, dict]]) -> list[QADocument]:
+        """
+        (문서 ID, 메타데이터) → Domain Entity 리스트 (입력 순서 유지)
+
+        question/answer 메타데이터가 있으면 바로 변환하고,
+        없는 기존 문서만 임베딩 텍스트(문서 본문)를 추가 조회해 파싱합니다.
+        """
+        legacy_ids = [doc_id for doc_id, metadata in items if not self._has_qa(metadata)]
+        documents: dict[str, str] = {}
+        if legacy_ids:
+            results = await self._read(self.collection.get, ids=legacy_ids, include=["documents"])
+            documents = dict(zip(results["ids"], results["documents"], strict=True))
+
+        return [
+            self._to_entity(metadata, documents.get(doc_id, ""))
+            for doc_id, metadata in items
+            # 조회 사이에 삭제된 기존 문서는 제외
+            if self._has_qa(metadata) or doc_id in documents
+        ]
+
+    async def _get_entities(self, **kwargs) -> list[QADocument]:
+        """collection.get 결과 → Domain Entity 리스트 (동기 API → 스레드 풀에서 실행)"""
+        results = await self._read(self.collection.get, include=["metadatas"], **kwargs)
+        return await self._to_entities_from_metadatas(
+            list(zip(results["ids"], results["metadatas"], strict=True))
+        )
 
+    @staticmethod
+    def _has_qa(metadata: dict) -> bool:
+        """메타데이터에 질문/답변 원문이 있는지 (없으면 이전 버전에서 저장된 문서)"""
+        return metadata.get("question") is not None and metadata.get("answer") is not None
+
+    def _to_entity(self, metadata: dict, document: str) -> QADocument:
+        """ChromaDB 메타데이터 + 문서 → Domain Entity"""
+        if self._has_qa(metadata):
+            question, answer = metadata["question"], metadata["answer"]
+        else:
+            # question/answer 메타데이터가 없는 기존 문서는 임베딩 텍스트 파싱
+            question, answer = self._parse_embedding_text(document)
+
+        # 결과마다 반복되는 ID/역할 문자열은 intern으로 한 객체 공유 (행마다 새 문자열 생성 방지)
+        return QADocument(
+            family_id=sys.intern(metadata["family_id"]),
+            member_id=sys.intern(metadata["member_id"]),
+            role_label=sys.intern(metadata["role_label"]),
+            question=question,
+            answer=answer,
+            answered_at=datetime.fromisoformat(metadata["answered_at"]),
+        )
+
+    def _to_domain_entities(self, results: dict) -> list[QADocument]:
+        """ChromaDB 결과 → Domain Entity 리스트"""
+        if not results["ids"] or not results["ids"][0]:
+            return []
+
+        return [
+            self._to_entity(metadata, document)
+            for metadata, document in zip(
+                results["metadatas"][0], results["documents"][0], strict=True
+            )
+        ]
+
+    @staticmethod
+    def _parse_embedding_text(text: str) -> tuple[str, str]:
+        """임베딩 텍스트 파싱 → (질문, 답변) (형식이 다르면 (원문, ""))"""
+        # partition: 구분자 기준 1회 분할 (답변 안에 "\n답변:"이 있어도 첫 구분자만 사용)
+        _, has_question, rest = text.partition("받은 질문:")
+        question, has_answer, answer = rest.partition("\n답변:")
+        if has_question and has_answer:
+            return question.strip(), answer.strip()
         return text, ""
@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -10,10 +11,13 @@ from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.adapters.openai_client import close_http_client, get_http_client
+from app.core import background
 from app.core.config import settings
 
 # Clean Architecture Router
@@ -29,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 # Langsmith 활성화 여부 로깅
 if settings.langchain_tracing_v2.lower() == "true":
-    logger.info(f"✅ Langsmith 추적 활성화: project={settings.langchain_project}")
+    logger.info("✅ Langsmith 추적 활성화: project=%s", settings.langchain_project)
 else:
     logger.info("⚠️  Langsmith 추적 비활성화 (LANGCHAIN_TRACING_V2=false)")
 
@@ -51,24 +55,48 @@ async def lifespan(app: FastAPI):
             write_test_path.unlink(missing_ok=True)
         except Exception as e:
             logger.error(
-                f"[lifespan] chroma persist dir not writable: {persist_dir}", exc_info=True
+                "[lifespan] chroma persist dir not writable: %s", persist_dir, exc_info=True
             )
             raise RuntimeError(f"Chroma persist directory is not writable: {persist_dir}") from e
 
         # DI 싱글톤 생성(초기화) 트리거
         from app.presentation.dependencies import (
-            get_chroma_collection,
             get_family_generator,
+            get_openai_client,
             get_personal_generator,
             get_summary_generator,
             get_vector_store,
         )
 
-        get_chroma_collection()
-        get_vector_store()
-        get_personal_generator()
-        get_family_generator()
-        get_summary_generator()
+        # 여러 싱글톤이 공유하는 객체는 먼저 생성 (스레드끼리 중복 생성 방지)
+        get_http_client()
+        openai_client = get_openai_client()
+
+        # 서로 독립인 초기화는 동시에 실행 (블로킹 I/O는 스레드 풀에서)
+        # - Chroma 열기 + answered_at_ts 보정 (get_vector_store가 컬렉션도 생성)
+        # - 프롬프트 YAML 로드 + 체인 구성
+        # - OpenAI 연결 warm-up (임베딩/LLM이 같은 HTTP 클라이언트를 공유하므로 한 번이면 충분)
+        initializers = (
+            get_vector_store,
+            get_personal_generator,
+            get_family_generator,
+            get_summary_generator,
+        )
+        results = await asyncio.gather(
+            *(asyncio.to_thread(initializer) for initializer in initializers),
+            openai_client.warmup(),
+            return_exceptions=True,
+        )
+        failed = [
+            (initializer.__name__, result)
+            # 마지막 결과는 warm-up (실패해도 예외를 내지 않음)
+            for initializer, result in zip(initializers, results[:-1], strict=True)
+            if isinstance(result, BaseException)
+        ]
+        for name, error in failed:
+            logger.error("[lifespan] %s failed", name, exc_info=error)
+        if failed:
+            raise failed[0][1]
 
         logger.info("[lifespan] startup: initialization complete")
     except Exception:
@@ -77,6 +105,13 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("[lifespan] shutdown")
+    # 백그라운드 저장 등 남은 작업 마무리 (무한 대기 방지용 timeout)
+    await background.drain(timeout=10.0)
+    from app.presentation.dependencies import close_vector_store
+
+    # 스레드 풀 종료는 진행 중인 ChromaDB 호출을 기다리는 블로킹 호출 → 이벤트 루프 밖에서 실행
+    await asyncio.to_thread(close_vector_store)
+    await close_http_client()
 
 
 # FastAPI 앱 생성
@@ -85,18 +120,27 @@ app = FastAPI(
     description="가족 유대감을 위한 AI 질문 생성 서버",
     version="2.0.0",
     lifespan=lifespan,
+    # 응답 JSON 직렬화를 orjson(C 구현)으로
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정 (cors_allowed_origins: "*" 또는 쉼표 구분 목록, 운영에서는 구체적 origin 권장)
+# "*"일 때 credentials를 허용하면 요청마다 Origin을 그대로 되돌려줘야 하므로(브라우저 규칙)
+# credentials는 origin 목록을 지정한 경우에만 허용 → "*"는 미리 계산된 헤더를 그대로 사용
+_cors_allow_all = settings.cors_allowed_origins.strip() == "*"
 _cors_origins = (
     ["*"]
-    if settings.cors_allowed_origins.strip() == "*"
+    if _cors_allow_all
     else [o.strip() for o in settings.cors_allowed_origins.split(",") if o.strip()]
 )
+if _cors_allow_all:
+    logger.warning(
+        "⚠️  CORS 모든 origin 허용 (credentials 비활성화): CORS_ALLOWED_ORIGINS 지정 권장"
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
-    allow_credentials=True,
+    allow_credentials=not _cors_allow_all,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -111,9 +155,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         request.url.path,
         exc.errors(),
     )
-    return JSONResponse(
+    # errors()의 ctx에는 예외 객체 등 JSON 타입이 아닌 값이 올 수 있으므로 인코딩 후 반환
+    return ORJSONResponse(
         status_code=422,
-        content={"detail": exc.errors(), "message": "요청 데이터 검증에 실패했습니다."},
+        content={
+            "detail": jsonable_encoder(exc.errors()),
+            "message": "요청 데이터 검증에 실패했습니다.",
+        },
     )
 
 
@@ -145,4 +193,16 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=True)
+    if settings.environment == "production":
+        # uvloop + httptools, reload 없음 (workers는 import 문자열로만 동작, reload와 병행 불가)
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            workers=settings.web_concurrency,
+            loop="uvloop",
+            http="httptools",
+            log_level=settings.log_level.lower(),
+        )
+    else:
+        uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=True)
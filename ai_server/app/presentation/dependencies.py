@@ -12,14 +12,15 @@ import chromadb
 from chromadb.config import Settings as ChromaSettings
 from fastapi import Depends
 
-from app.adapters.openai_client import OpenAIClient
+from app.adapters.openai_client import OpenAIClient, get_http_client
 from app.application.use_cases.family_recent_question import FamilyRecentQuestionUseCase
 from app.application.use_cases.family_summary import FamilySummaryUseCase
 from app.application.use_cases.generate_family_question import GenerateFamilyQuestionUseCase
 from app.application.use_cases.generate_personal_question import (
     GeneratePersonalQuestionUseCase,
 )
-from app.core.config import settings
+from app.core.cache import LRUCache
+from app.core.config import get_settings
 from app.domain.ports.question_generator_port import QuestionGeneratorPort
 from app.domain.ports.summary_generator_port import SummaryGeneratorPort
 from app.domain.ports.vector_store_port import VectorStorePort
@@ -38,6 +39,9 @@ _vector_store: VectorStorePort | None = None
 _personal_generator: QuestionGeneratorPort | None = None
 _family_generator: QuestionGeneratorPort | None = None
 _summary_generator: SummaryGeneratorPort | None = None
+_question_candidate_cache: LRUCache | None = None
+_asked_question_cache: LRUCache | None = None
+_summary_cache: LRUCache | None = None
 
 
 # === Infrastructure Layer ===
@@ -58,18 +62,25 @@ def get_chroma_collection() -> Any:
     if _chroma_collection is None:
         logger.info("[DI] ChromaDB Collection 생성")
         client = chromadb.PersistentClient(
-            path=settings.chroma_persist_directory,
+            path=get_settings().chroma_persist_directory,
             settings=ChromaSettings(anonymized_telemetry=False, allow_reset=False),
         )
-        _chroma_collection = client.get_or_create_collection(
-            name=settings.chroma_collection_name,
-            metadata={
-                "description": "가족 QA 히스토리",
-                "embedding_model": settings.embedding_model,
-            },
-        )
+        name = get_settings().chroma_collection_name
+        if name in {collection.name for collection in client.list_collections()}:
+            # 기존 컬렉션: 거리 공간(hnsw:space)은 생성 시 고정 → 메타데이터를 덮어쓰지 않음
+            _chroma_collection = client.get_collection(name=name)
+        else:
+            # 신규 컬렉션: 정규화된 임베딩을 저장하므로 내적(ip) = 코사인 유사도
+            _chroma_collection = client.get_or_create_collection(
+                name=name,
+                metadata={
+                    "description": "가족 QA 히스토리",
+                    "embedding_model": get_settings().embedding_model,
+                    "hnsw:space": "ip",
+                },
+            )
         logger.info(
-            f"[DI] ChromaDB Collection 준비 완료: " f"기존 데이터={_chroma_collection.count()}개"
+            "[DI] ChromaDB Collection 준비 완료: 기존 데이터=%s개", _chroma_collection.count()
         )
     return _chroma_collection
 
@@ -85,13 +96,30 @@ def get_vector_store() -> VectorStorePort:
     global _vector_store
     if _vector_store is None:
         logger.info("[DI] ChromaVectorStore 생성")
-        _vector_store = ChromaVectorStore(
+        vector_store = ChromaVectorStore(
             openai_client=get_openai_client(),
             collection=get_chroma_collection(),
+            similarity_cache_size=get_settings().similarity_cache_size,
+            similarity_cache_ttl=get_settings().similarity_cache_ttl_seconds,
+            read_workers=get_settings().chroma_read_workers,
         )
+        # 기간 조회용 answered_at_ts가 없는 기존 문서 보정 (완료 표시가 있으면 즉시 종료)
+        try:
+            vector_store.backfill_answered_at_ts()
+        except Exception:
+            logger.exception("[DI] answered_at_ts 보정 실패 (기존 문서는 기간 조회에서 누락)")
+        _vector_store = vector_store
     return _vector_store
 
 
+def close_vector_store() -> None:
+    """벡터 스토어 리소스 정리 (서버 종료 시, 생성된 적 없으면 무시, 블로킹)"""
+    global _vector_store
+    if _vector_store is not None:
+        _vector_store.close()
+        _vector_store = None
+
+
 def get_personal_generator() -> QuestionGeneratorPort:
     """
     개인 질문 생성기 싱글톤 (인터페이스 반환)
@@ -108,8 +136,10 @@ def get_personal_generator() -> QuestionGeneratorPort:
 
         _personal_generator = LangchainPersonalGenerator(
             prompt_data=prompt_data,
-            model=settings.default_model,
-            temperature=settings.temperature,
+            model=get_settings().default_model,
+            temperature=get_settings().temperature,
+            http_client=get_http_client(),
+            max_tokens=get_settings().question_max_tokens,
         )
     return _personal_generator
 
@@ -130,8 +160,10 @@ def get_family_generator() -> QuestionGeneratorPort:
 
         _family_generator = LangchainFamilyGenerator(
             prompt_data=prompt_data,
-            model=settings.default_model,
-            temperature=settings.temperature,
+            model=get_settings().default_model,
+            temperature=get_settings().temperature,
+            http_client=get_http_client(),
+            max_tokens=get_settings().question_max_tokens,
         )
     return _family_generator
 
@@ -145,12 +177,46 @@ def get_summary_generator() -> SummaryGeneratorPort:
         prompt_data = prompt_loader.load("summary_headline.yaml")
         _summary_generator = LangChainSummaryGenerator(
             prompt_data=prompt_data,
-            model=settings.default_model,
-            temperature=settings.temperature,
+            model=get_settings().default_model,
+            temperature=get_settings().temperature,
+            http_client=get_http_client(),
         )
     return _summary_generator
 
 
+def get_question_candidate_cache() -> LRUCache:
+    """질문 후보 캐시 싱글톤 (Use Case는 요청마다 생성되므로 캐시는 공유)"""
+    global _question_candidate_cache
+    if _question_candidate_cache is None:
+        _question_candidate_cache = LRUCache(
+            max_size=get_settings().question_cache_size,
+            ttl=get_settings().question_cache_ttl_seconds,
+        )
+    return _question_candidate_cache
+
+
+def get_asked_question_cache() -> LRUCache:
+    """멤버별 이미 받은 질문 키 캐시 싱글톤 (member_id → 질문 키 집합, 요청 간 공유)"""
+    global _asked_question_cache
+    if _asked_question_cache is None:
+        _asked_question_cache = LRUCache(
+            max_size=get_settings().asked_question_cache_size,
+            ttl=get_settings().asked_question_cache_ttl_seconds,
+        )
+    return _asked_question_cache
+
+
+def get_summary_cache() -> LRUCache:
+    """요약 캐시 싱글톤 (Use Case는 요청마다 생성되므로 캐시는 공유)"""
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = LRUCache(
+            max_size=get_settings().summary_cache_size,
+            ttl=get_settings().summary_cache_ttl_seconds,
+        )
+    return _summary_cache
+
+
 # === Application Layer (Use Cases) ===
 
 
@@ -166,6 +232,8 @@ def get_personal_question_use_case() -> GeneratePersonalQuestionUseCase:
     return GeneratePersonalQuestionUseCase(
         vector_store=get_vector_store(),  # ← Port (인터페이스)
         question_generator=get_personal_generator(),  # ← Port (인터페이스)
+        candidate_cache=get_question_candidate_cache(),
+        asked_questions=get_asked_question_cache(),
     )
 
 
@@ -179,6 +247,8 @@ def get_family_question_use_case() -> GenerateFamilyQuestionUseCase:
     return GenerateFamilyQuestionUseCase(
         vector_store=get_vector_store(),  # ← Port (인터페이스)
         question_generator=get_family_generator(),  # ← Port (인터페이스)
+        candidate_cache=get_question_candidate_cache(),
+        asked_questions=get_asked_question_cache(),
     )
 
 
@@ -192,6 +262,8 @@ def get_family_recent_question_use_case() -> FamilyRecentQuestionUseCase:
     return FamilyRecentQuestionUseCase(
         vector_store=get_vector_store(),  # ← Port (인터페이스)
         question_generator=get_family_generator(),  # ← Port (인터페이스, 가족용 프롬프트)
+        candidate_cache=get_question_candidate_cache(),
+        asked_questions=get_asked_question_cache(),
     )
 
 
@@ -206,6 +278,7 @@ def get_family_summary_use_case() -> FamilySummaryUseCase:
     return FamilySummaryUseCase(
         vector_store=get_vector_store(),
         summary_generator=get_summary_generator(),
+        summary_cache=get_summary_cache(),
     )
 
 
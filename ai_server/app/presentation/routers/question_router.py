@@ -88,8 +88,9 @@ async def generate_personal_question(
     """
     try:
         logger.info(
-            f"[API] 개인 질문 생성 요청: family_id={request.familyId}, "
-            f"member_id={request.memberId}"
+            "[API] 개인 질문 생성 요청: family_id=%s, member_id=%s",
+            request.familyId,
+            request.memberId,
         )
         use_case_input = GeneratePersonalQuestionInput(
             family_id=request.familyId,
@@ -102,13 +103,13 @@ async def generate_personal_question(
         response = await _execute_question_generation(
             use_case_input, use_case, request.memberId, 2, "[API] 개인 질문 생성"
         )
-        logger.info(f"[API] 개인 질문 생성 완료: {response.content[:30]}...")
+        logger.info("[API] 개인 질문 생성 완료: %.30s...", response.content)
         return response
     except ValueError as e:
-        logger.error(f"[API] 개인 질문 생성 실패 (잘못된 입력): {e}", exc_info=True)
+        logger.error("[API] 개인 질문 생성 실패 (잘못된 입력): %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}") from e
     except Exception as e:
-        logger.error(f"[API] 개인 질문 생성 실패: {e}", exc_info=True)
+        logger.error("[API] 개인 질문 생성 실패: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"질문 생성 실패: {str(e)}") from e
 
 
@@ -134,8 +135,9 @@ async def generate_family_question(
     """
     try:
         logger.info(
-            f"[API] 가족 질문 생성 요청: family_id={request.familyId}, "
-            f"member_id={request.memberId}"
+            "[API] 가족 질문 생성 요청: family_id=%s, member_id=%s",
+            request.familyId,
+            request.memberId,
         )
         use_case_input = GenerateFamilyQuestionInput(
             family_id=request.familyId,
@@ -147,13 +149,13 @@ async def generate_family_question(
         response = await _execute_question_generation(
             use_case_input, use_case, request.memberId, 3, "[API] 가족 질문 생성"
         )
-        logger.info(f"[API] 가족 질문 생성 완료: {response.content[:30]}...")
+        logger.info("[API] 가족 질문 생성 완료: %.30s...", response.content)
         return response
     except ValueError as e:
-        logger.error(f"[API] 가족 질문 생성 실패 (잘못된 입력): {e}", exc_info=True)
+        logger.error("[API] 가족 질문 생성 실패 (잘못된 입력): %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}") from e
     except Exception as e:
-        logger.error(f"[API] 가족 질문 생성 실패: {e}", exc_info=True)
+        logger.error("[API] 가족 질문 생성 실패: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"질문 생성 실패: {str(e)}") from e
 
 
@@ -177,8 +179,9 @@ async def generate_family_recent_question(
     """
     try:
         logger.info(
-            f"[API] 가족 최근 질문 생성 요청: family_id={request.familyId}, "
-            f"target={request.memberId}"
+            "[API] 가족 최근 질문 생성 요청: family_id=%s, target=%s",
+            request.familyId,
+            request.memberId,
         )
         use_case_input = FamilyRecentQuestionInput(
             family_id=request.familyId,
@@ -187,11 +190,11 @@ async def generate_family_recent_question(
         response = await _execute_question_generation(
             use_case_input, use_case, request.memberId, 3, "[API] 가족 최근 질문 생성"
         )
-        logger.info(f"[API] 가족 최근 질문 생성 완료: {response.content[:30]}...")
+        logger.info("[API] 가족 최근 질문 생성 완료: %.30s...", response.content)
         return response
     except ValueError as e:
-        logger.error(f"[API] 가족 최근 질문 생성 실패 (잘못된 입력): {e}", exc_info=True)
+        logger.error("[API] 가족 최근 질문 생성 실패 (잘못된 입력): %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}") from e
     except Exception as e:
-        logger.error(f"[API] 가족 최근 질문 생성 실패: {e}", exc_info=True)
+        logger.error("[API] 가족 최근 질문 생성 실패: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"질문 생성 실패: {str(e)}") from e
@@ -40,8 +40,8 @@ async def get_family_summary(
         output: SummaryOutput = await use_case.execute(input_dto)
         return SummaryResponseSchema(context=output.context)
     except ValueError as e:
-        logger.error(f"[API] 요약 생성 실패 (잘못된 입력): {e}", exc_info=True)
+        logger.error("[API] 요약 생성 실패 (잘못된 입력): %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}") from e
     except Exception as e:
-        logger.error(f"[API] 요약 생성 실패: {e}", exc_info=True)
+        logger.error("[API] 요약 생성 실패: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"요약 생성 실패: {str(e)}") from e
@@ -57,6 +57,23 @@ class TestQADocumentEntity:
         assert month == 1
         assert day == 20
 
+    def test_to_embedding_text(self):
+        """임베딩 텍스트 포맷 (벡터 스토어 저장/요약 공통)"""
+        from app.domain.entities.qa_document import QADocument
+
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="오늘 뭐 했어?",
+            answer="친구들과 놀았어요",
+            answered_at=datetime(2026, 1, 5, 14, 30, 0),
+        )
+
+        assert doc.to_embedding_text() == (
+            "2026년 1월 5일에 첫째 딸이(가) 받은 질문: 오늘 뭐 했어?\n답변: 친구들과 놀았어요"
+        )
+
     def test_is_recent_within_30_days(self):
         """[RED] 최근 답변 여부 확인 - 30일 이내"""
         # Given
@@ -99,6 +116,22 @@ class TestQADocumentEntity:
         # When/Then
         assert doc.is_recent(days=30) is False
 
+    def test_is_recent_with_fixed_now(self):
+        """기준 시각(now)을 넘기면 그 시각 기준으로 판단"""
+        from app.domain.entities.qa_document import QADocument
+
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="테스트",
+            answer="테스트",
+            answered_at=datetime(2026, 1, 1, 9, 0, 0),
+        )
+
+        assert doc.is_recent(days=30, now=datetime(2026, 1, 31, 9, 0, 0)) is True
+        assert doc.is_recent(days=30, now=datetime(2026, 2, 1, 9, 0, 0)) is False
+
     def test_qa_document_immutability(self):
         """[RED] QADocument는 dataclass(frozen=True)로 불변이어야 함"""
         # Given
@@ -117,6 +150,21 @@ class TestQADocumentEntity:
         with pytest.raises(AttributeError):
             doc.question = "변경 시도"
 
+    def test_qa_document_uses_slots(self):
+        """QADocument는 slots dataclass (인스턴스 __dict__ 없음)"""
+        from app.domain.entities.qa_document import QADocument
+
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="테스트",
+            answer="테스트",
+            answered_at=datetime.now(),
+        )
+
+        assert not hasattr(doc, "__dict__")
+
 
 class TestQuestionLevelValueObject:
     """QuestionLevel Value Object 테스트"""
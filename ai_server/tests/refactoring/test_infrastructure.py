@@ -6,6 +6,7 @@ Port 인터페이스 구현체 테스트:
 - LangchainPersonalGenerator (QuestionGeneratorPort 구현)
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -58,6 +59,7 @@ class TestChromaVectorStore:
             }
         )
         mock.count = MagicMock(return_value=10)
+        mock.metadata = {"hnsw:space": "ip"}
         return mock
 
     def test_chroma_vector_store_implements_port(self):
@@ -111,6 +113,77 @@ class TestChromaVectorStore:
         assert metadata["family_id"] == "family-1"
         assert metadata["member_id"] == "member-10"
         assert metadata["role_label"] == "첫째 딸"
+        assert metadata["question"] == "오늘 뭐 했어?"
+        assert metadata["answer"] == "친구들과 놀았어요"
+
+    @pytest.mark.asyncio
+    async def test_store_same_member_twice_gets_distinct_ids(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """같은 밀리초에 같은 멤버 문서를 저장해도 ID가 겹치지 않음 (중복 ID add는 무시되므로)"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="오늘 뭐 했어?",
+            answer="친구들과 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        with patch("app.infrastructure.vector.chroma_vector_store.time.time_ns", return_value=0):
+            await vector_store.store(doc)
+            await vector_store.store(doc)
+
+        first, second = (
+            call.kwargs["ids"][0] for call in mock_chroma_collection.add.call_args_list
+        )
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_chroma_calls_run_on_dedicated_threads(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """쓰기는 전용 쓰기 스레드, 조회는 조회 전용 스레드 풀에서 실행"""
+        import threading
+
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        threads = {}
+        mock_chroma_collection.add.side_effect = lambda **_: threads.setdefault(
+            "add", threading.current_thread().name
+        )
+        query = mock_chroma_collection.query.return_value
+        mock_chroma_collection.query.side_effect = lambda **_: (
+            threads.setdefault("query", threading.current_thread().name) and query
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="오늘 뭐 했어?",
+            answer="친구들과 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        await vector_store.store(doc)
+        await vector_store.search_by_member(member_id="member-10", query_doc=doc, top_k=2)
+        vector_store.close()
+
+        assert threads["add"].startswith("chroma-write")
+        assert threads["query"].startswith("chroma-read")
 
     @pytest.mark.asyncio
     async def test_chroma_vector_store_search_by_member(
@@ -150,6 +223,526 @@ class TestChromaVectorStore:
         assert call_kwargs["n_results"] == 5
         assert call_kwargs["where"] == {"member_id": "member-10"}
 
+    @pytest.mark.asyncio
+    async def test_search_similar_questions_cached_until_member_store(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """유사도 검색 캐시 - 같은 질문 재검색 시 캐시, 멤버 문서 저장 시 무효화"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        first = await vector_store.search_similar_questions("같은 질문", "member-10")
+        second = await vector_store.search_similar_questions("같은 질문", "member-10")
+
+        assert first == second
+        assert mock_chroma_collection.query.call_count == 1
+
+        await vector_store.store(
+            QADocument(
+                family_id="family-1",
+                member_id="member-10",
+                role_label="첫째 딸",
+                question="새 질문",
+                answer="새 답변",
+                answered_at=datetime(2026, 1, 20, 14, 30, 0),
+            )
+        )
+        await vector_store.search_similar_questions("같은 질문", "member-10")
+
+        assert mock_chroma_collection.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_similar_questions_batch_single_query(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """후보 유사도 일괄 검색 - 캐시 미스만 임베딩 1회 + 쿼리 1회"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[0.1] * 1536] * 2)
+        mock_chroma_collection.query.return_value = {"distances": [[0.05], []]}
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        vector_store._similarity_cache.set(
+            vector_store._similarity_cache_key("캐시된 질문", "member-10"), 0.5
+        )
+
+        similarities = await vector_store.search_similar_questions_batch(
+            ["캐시된 질문", "중복 질문", "새 질문"], "member-10"
+        )
+
+        assert similarities == [0.5, 0.95, 0.0]
+        mock_openai_client.create_embeddings.assert_awaited_once_with(["중복 질문", "새 질문"])
+        mock_chroma_collection.query.assert_called_once()
+        assert mock_chroma_collection.query.call_args.kwargs["n_results"] == 1
+        assert mock_chroma_collection.query.call_args.kwargs["where"] == {"member_id": "member-10"}
+
+    @pytest.mark.asyncio
+    async def test_search_similar_questions_batch_skips_excluded_document(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """exclude 문서(저장 중인 base_qa)는 건너뛰고 그다음 최근접 거리로 유사도 계산"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        base_qa = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="오늘 뭐 했어?",
+            answer="친구들과 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[0.1] * 1536] * 2)
+        older = {
+            "member_id": "member-10",
+            "question": "예전 질문",
+            "answered_at": "2026-01-01T09:00:00",
+        }
+        mock_chroma_collection.query.return_value = {
+            # 1번 후보: base_qa가 이미 저장돼 최근접 / 2번 후보: 아직 저장 전
+            "distances": [[0.0, 0.4], [0.2]],
+            "metadatas": [[vector_store._to_metadata(base_qa), older], [older]],
+        }
+
+        similarities = await vector_store.search_similar_questions_batch(
+            ["오늘 뭐 했니?", "새 질문"], "member-10", exclude=base_qa
+        )
+
+        assert similarities == pytest.approx([0.6, 0.8])
+        assert mock_chroma_collection.query.call_args.kwargs["n_results"] == 2
+
+    @pytest.mark.asyncio
+    async def test_store_many_single_embedding_request_and_add(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """일괄 저장 - 임베딩 1회 요청 + ChromaDB add 1회, 배치 내 ID 중복 없음"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[1.0, 0.0], [0.0, 2.0]])
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        docs = [
+            QADocument(
+                family_id="family-1",
+                member_id=member_id,
+                role_label="첫째 딸",
+                question="오늘 뭐 했어?",
+                answer="놀았어요",
+                answered_at=datetime(2026, 1, 20, 14, 30, 0),
+            )
+            for member_id in ("member-10", "member-10")
+        ]
+
+        stored = await vector_store.store_many(docs)
+
+        assert stored == 2
+        mock_openai_client.create_embeddings.assert_awaited_once()
+        mock_chroma_collection.add.assert_called_once()
+        add_kwargs = mock_chroma_collection.add.call_args.kwargs
+        assert len(set(add_kwargs["ids"])) == 2
+        assert add_kwargs["embeddings"] == [[1.0, 0.0], [0.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_store_many_partial_failure_returns_committed_count(
+        self, mock_openai_client, mock_chroma_collection, monkeypatch
+    ):
+        """일괄 저장 - 뒤 배치 실패 시 커밋된 배치 수만큼 반환 + 해당 멤버 캐시 무효화"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector import chroma_vector_store as module
+
+        monkeypatch.setattr(module, "CHROMA_BATCH_SIZE", 1)
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+        mock_chroma_collection.add.side_effect = [None, RuntimeError("disk full")]
+        vector_store = module.ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        docs = [
+            QADocument(
+                family_id=family_id,
+                member_id=member_id,
+                role_label="첫째 딸",
+                question="오늘 뭐 했어?",
+                answer="놀았어요",
+                answered_at=datetime(2026, 1, 20, 14, 30, 0),
+            )
+            for family_id, member_id in (("family-1", "member-10"), ("family-2", "member-20"))
+        ]
+        vector_store._invalidate_member = MagicMock()
+
+        stored = await vector_store.store_many(docs)
+
+        assert stored == 1
+        assert mock_chroma_collection.add.call_count == 2
+        vector_store._invalidate_member.assert_called_once_with("member-10")
+        assert "family-1" in vector_store._known_families
+        assert "family-2" not in vector_store._known_families
+
+    @pytest.mark.asyncio
+    async def test_store_and_query_use_normalized_embeddings(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """저장/검색 임베딩은 단위 벡터로 정규화"""
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_openai_client.create_embedding = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[3.0, 4.0])])
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        doc = QADocument(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            question="오늘 뭐 했어?",
+            answer="놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        await vector_store.store(doc)
+        await vector_store.search_by_member(member_id="member-10", query_doc=doc)
+
+        stored = mock_chroma_collection.add.call_args.kwargs["embeddings"][0]
+        queried = mock_chroma_collection.query.call_args.kwargs["query_embeddings"][0]
+        assert stored == pytest.approx([0.6, 0.8])
+        assert queried == pytest.approx([0.6, 0.8])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("metadata", "distance", "expected"),
+        [
+            ({"hnsw:space": "ip"}, 0.1, 0.9),
+            ({"hnsw:space": "cosine"}, 0.1, 0.9),
+            ({}, 0.2, 0.9),  # 기본 l2: 제곱 거리 = 2 - 2cos
+        ],
+    )
+    async def test_similarity_conversion_by_distance_space(
+        self, mock_openai_client, mock_chroma_collection, metadata, distance, expected
+    ):
+        """컬렉션 거리 공간(hnsw:space)에 맞게 distance → 코사인 유사도 변환"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[0.1] * 1536])
+        mock_chroma_collection.metadata = metadata
+        mock_chroma_collection.query.return_value = {"distances": [[distance]]}
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        similarities = await vector_store.search_similar_questions_batch(["질문"], "member-10")
+
+        assert similarities == [pytest.approx(expected)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("distance", "is_duplicate"),
+        [
+            (0.08, True),  # cos 0.96
+            (0.12, False),  # cos 0.94: 예전 판정(2cos - 1 = 0.88 < 0.9)과 동일하게 통과
+        ],
+    )
+    async def test_similarity_threshold_on_l2_collection(
+        self, mock_openai_client, mock_chroma_collection, distance, is_duplicate
+    ):
+        """기존 l2 컬렉션의 중복 판정 기준은 cos ≥ 0.95 (변환 수정 전과 동일)"""
+        from app.core.config import get_settings
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_openai_client.create_embeddings = AsyncMock(return_value=[[0.1] * 1536])
+        mock_chroma_collection.metadata = {}
+        mock_chroma_collection.query.return_value = {"distances": [[distance]]}
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        [similarity] = await vector_store.search_similar_questions_batch(["질문"], "member-10")
+
+        assert get_settings().similarity_threshold == 0.95
+        assert (similarity >= get_settings().similarity_threshold) is is_duplicate
+
+    @pytest.mark.asyncio
+    async def test_get_recent_questions_by_member_fetches_selected_documents_only(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """최근 질문 조회 - 메타데이터로 상위 N개 선택 후 (기존 문서는) 해당 ID의 본문만 조회"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        metadatas = [
+            {
+                "family_id": "family-1",
+                "member_id": "member-10",
+                "role_label": "첫째 딸",
+                "answered_at": answered_at,
+            }
+            for answered_at in ("2026-01-14T15:30:00", "2026-01-16T09:00:00", "2026-01-15T10:00:00")
+        ]
+        mock_chroma_collection.get = MagicMock(
+            side_effect=[
+                {"ids": ["doc1", "doc2", "doc3"], "metadatas": metadatas},
+                {
+                    "ids": ["doc3", "doc2"],
+                    "metadatas": [metadatas[2], metadatas[1]],
+                    "documents": [
+                        "2026년 1월 15일에 첫째 딸이(가) 받은 질문: 어제 질문\n답변: 답",
+                        "2026년 1월 16일에 첫째 딸이(가) 받은 질문: 오늘 질문\n답변: 답",
+                    ],
+                },
+            ]
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        recent = await vector_store.get_recent_questions_by_member("member-10", limit=2)
+
+        assert [doc.question for doc in recent] == ["오늘 질문", "어제 질문"]
+        first_call, second_call = mock_chroma_collection.get.call_args_list
+        assert first_call.kwargs["include"] == ["metadatas"]
+        assert second_call.kwargs["ids"] == ["doc2", "doc3"]
+        assert second_call.kwargs["include"] == ["documents"]
+
+    @pytest.mark.asyncio
+    async def test_get_recent_questions_by_family_builds_entities_from_metadata(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """가족 최근 질문 조회 - 메타데이터에 질문/답변이 있으면 본문 재조회 없이 1회 조회"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        metadatas = [
+            {
+                "family_id": "family-1",
+                "member_id": member_id,
+                "role_label": "첫째 딸",
+                "question": question,
+                "answer": "답",
+                "answered_at": answered_at,
+            }
+            for member_id, question, answered_at in (
+                ("member-10", "옛 질문", "2026-01-14T15:30:00"),
+                ("member-10", "새 질문", "2026-01-16T09:00:00"),
+                ("member-20", "엄마 질문", "2026-01-15T10:00:00"),
+            )
+        ]
+        mock_chroma_collection.get = MagicMock(
+            return_value={"ids": ["doc1", "doc2", "doc3"], "metadatas": metadatas}
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        recent = await vector_store.get_recent_questions_by_family("family-1", limit_per_member=1)
+
+        assert [doc.question for doc in recent] == ["새 질문", "엄마 질문"]
+        mock_chroma_collection.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_qa_by_family_in_range_pushes_range_filter(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """기간 조회 - answered_at_ts 범위 조건을 ChromaDB where로 전달"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_chroma_collection.get = MagicMock(
+            return_value={"ids": [], "metadatas": [], "documents": []}
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        start, end = datetime(2026, 1, 12), datetime(2026, 1, 18, 23, 59, 59)
+
+        await vector_store.get_qa_by_family_in_range("family-1", start, end)
+
+        assert mock_chroma_collection.get.call_args.kwargs["where"] == {
+            "$and": [
+                {"family_id": "family-1"},
+                {"answered_at_ts": {"$gte": start.timestamp()}},
+                {"answered_at_ts": {"$lte": end.timestamp()}},
+            ]
+        }
+
+    def test_backfill_answered_at_ts_updates_legacy_documents(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """answered_at_ts가 없는 기존 문서만 보정, 해석 불가 문서는 건너뛰고 완료 표시 기록"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        legacy = {"member_id": "member-10", "answered_at": "2026-01-15T10:00:00"}
+        broken = {"member_id": "member-10", "answered_at": "not-a-date"}
+        current = {**legacy, "answered_at_ts": 1.0}
+        mock_chroma_collection.get = MagicMock(
+            return_value={"ids": ["old", "bad", "new"], "metadatas": [legacy, broken, current]}
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        assert vector_store.backfill_answered_at_ts() == 1
+        mock_chroma_collection.update.assert_called_once_with(
+            ids=["old"],
+            metadatas=[{**legacy, "answered_at_ts": datetime(2026, 1, 15, 10, 0, 0).timestamp()}],
+        )
+        # hnsw:space는 modify에 넘길 수 없으므로 사본 키로 보존
+        mock_chroma_collection.modify.assert_called_once_with(
+            metadata={"distance_space": "ip", "answered_at_ts_backfilled": True}
+        )
+
+    def test_backfill_answered_at_ts_skips_when_already_done(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """완료 표시가 있으면 전체 스캔 생략 (거리 공간은 사본 키에서 복원)"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_chroma_collection.metadata = {
+            "distance_space": "ip",
+            "answered_at_ts_backfilled": 1,
+        }
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        assert vector_store.backfill_answered_at_ts() == 0
+        mock_chroma_collection.get.assert_not_called()
+        mock_chroma_collection.modify.assert_not_called()
+        assert vector_store._distance_space == "ip"
+
+    def test_to_entity_prefers_metadata_question_answer(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """메타데이터에 질문/답변이 있으면 임베딩 텍스트를 파싱하지 않음"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        metadata = {
+            "family_id": "family-1",
+            "member_id": "member-10",
+            "role_label": "첫째 딸",
+            "question": "질문\n답변: 포함",
+            "answer": "답",
+            "answered_at": "2026-01-15T10:00:00",
+        }
+
+        entity = vector_store._to_entity(metadata, "파싱하면 안 되는 텍스트")
+
+        assert (entity.question, entity.answer) == ("질문\n답변: 포함", "답")
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (
+                "2026년 1월 15일에 엄마이(가) 받은 질문: 뭐 먹을까?\n답변: 김밥",
+                ("뭐 먹을까?", "김밥"),
+            ),
+            ("받은 질문: 질문\n답변: 첫 줄\n답변: 인용", ("질문", "첫 줄\n답변: 인용")),
+            ("형식이 다른 텍스트", ("형식이 다른 텍스트", "")),
+        ],
+    )
+    def test_parse_embedding_text(self, text, expected):
+        """임베딩 텍스트 → (질문, 답변), 형식이 다르면 원문 그대로"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        assert ChromaVectorStore._parse_embedding_text(text) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_role_label_by_member_metadata_only(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """role_label 조회 - 메타데이터만 조회, 가장 최근 문서의 role_label 반환"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_chroma_collection.get = MagicMock(
+            return_value={
+                "ids": ["doc1", "doc2"],
+                "metadatas": [
+                    {"role_label": "딸", "answered_at": "2026-01-14T15:30:00"},
+                    {"role_label": "첫째 딸", "answered_at": "2026-01-15T10:00:00"},
+                ],
+            }
+        )
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        role_label = await vector_store.get_role_label_by_member("member-10")
+
+        assert role_label == "첫째 딸"
+        assert mock_chroma_collection.get.call_args.kwargs["include"] == ["metadatas"]
+
+    @pytest.mark.asyncio
+    async def test_family_has_docs_probe_and_remember(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """가족 문서 존재 확인 - 없으면 매번 id 1건 조회, 있으면 기억해서 재조회 안 함"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_chroma_collection.get = MagicMock(return_value={"ids": []})
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+
+        assert await vector_store.family_has_docs("family-new") is False
+        assert mock_chroma_collection.get.call_args.kwargs["limit"] == 1
+
+        mock_chroma_collection.get.return_value = {"ids": ["doc1"]}
+        assert await vector_store.family_has_docs("family-new") is True
+        assert await vector_store.family_has_docs("family-new") is True
+        assert mock_chroma_collection.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_by_member_forgets_known_family(
+        self, mock_openai_client, mock_chroma_collection
+    ):
+        """멤버 삭제 후에는 가족 문서 존재 여부를 다시 조회 (마지막 멤버 삭제 시 False)"""
+        from app.infrastructure.vector.chroma_vector_store import ChromaVectorStore
+
+        mock_chroma_collection.get = MagicMock(return_value={"ids": ["doc1"]})
+        vector_store = ChromaVectorStore(
+            openai_client=mock_openai_client,
+            collection=mock_chroma_collection,
+        )
+        assert await vector_store.family_has_docs("family-1") is True
+
+        mock_chroma_collection.get.return_value = {
+            "ids": ["doc1"],
+            "metadatas": [{"family_id": "family-1", "member_id": "member-10"}],
+        }
+        assert await vector_store.delete_by_member("member-10") == 1
+        mock_chroma_collection.delete.assert_called_once_with(ids=["doc1"])
+
+        mock_chroma_collection.get.return_value = {"ids": []}
+        assert await vector_store.family_has_docs("family-1") is False
+
 
 class TestLangchainPersonalGenerator:
     """LangchainPersonalGenerator 구현체 테스트"""
@@ -219,6 +812,197 @@ class TestLangchainPersonalGenerator:
                 # LangChain 호출 검증
                 mock_chain.ainvoke.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_langchain_personal_generator_generate_questions(self):
+        """generate_questions 메서드 - LLM 1회 호출(n개 후보), 파싱 실패 후보는 제외"""
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, LLMResult
+
+        from app.domain.entities.qa_document import QADocument
+        from app.infrastructure.llm.langchain_personal_generator import LangchainPersonalGenerator
+
+        with patch("app.infrastructure.llm.langchain_personal_generator.ChatOpenAI"):
+            generator = LangchainPersonalGenerator(
+                prompt_data={"system": "test", "user": "test"},
+                model="gpt-4o-mini",
+                temperature=0.2,
+            )
+            contents = [
+                '{"question": "질문 1", "level": 1}',
+                "잘못된 응답",
+                '{"question": "질문 3", "level": 3}',
+            ]
+            generator.llm.agenerate = AsyncMock(
+                return_value=LLMResult(
+                    generations=[[ChatGeneration(message=AIMessage(content=c)) for c in contents]]
+                )
+            )
+
+            base_qa = QADocument(
+                family_id="family-1",
+                member_id="member-10",
+                role_label="첫째 딸",
+                question="오늘 뭐 했어?",
+                answer="친구들과 놀았어요",
+                answered_at=datetime(2026, 1, 20, 14, 30, 0),
+            )
+
+            candidates = await generator.generate_questions(base_qa, [], n=3)
+
+            assert [(q, level.value) for q, level in candidates] == [("질문 1", 1), ("질문 3", 3)]
+            generator.llm.agenerate.assert_awaited_once()
+            assert generator.llm.agenerate.call_args.kwargs["n"] == 3
+
+    @pytest.mark.asyncio
+    async def test_langchain_generators_share_openai_request_limiter(self, monkeypatch):
+        """LLM 호출도 임베딩과 같은 프로세스 전역 동시 요청 상한 안에서 실행"""
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, LLMResult
+
+        from app.adapters import openai_client
+        from app.infrastructure.llm.langchain_family_generator import LangchainFamilyGenerator
+        from app.infrastructure.llm.langchain_personal_generator import LangchainPersonalGenerator
+
+        limiter = asyncio.Semaphore(1)
+        monkeypatch.setattr(openai_client, "_request_limiter", limiter)
+
+        async def agenerate(messages, n):
+            # 상한 1인 공유 세마포어를 이 호출이 점유 중이어야 함
+            assert openai_client.get_request_limiter() is limiter
+            assert limiter.locked()
+            content = '{"question": "질문", "level": 2}'
+            return LLMResult(generations=[[ChatGeneration(message=AIMessage(content=content))]])
+
+        for generator_cls, module in (
+            (LangchainPersonalGenerator, "langchain_personal_generator"),
+            (LangchainFamilyGenerator, "langchain_family_generator"),
+        ):
+            with patch(f"app.infrastructure.llm.{module}.ChatOpenAI"):
+                generator = generator_cls(
+                    prompt_data={"system": "test", "user": "test"},
+                    model="gpt-4o-mini",
+                    temperature=0.2,
+                )
+            generator.llm.agenerate = AsyncMock(side_effect=agenerate)
+
+            candidates = await generator.generate_questions_for_target(
+                target_member_id="member-10", target_role_label="첫째 딸", context=[], n=1
+            )
+
+            assert [question for question, _ in candidates] == ["질문"]
+            assert not limiter.locked()
+
+    @pytest.mark.parametrize(
+        ("getter", "attr"),
+        [
+            ("get_personal_generator", "_personal_generator"),
+            ("get_family_generator", "_family_generator"),
+        ],
+    )
+    def test_question_generators_send_question_max_tokens(self, monkeypatch, getter, attr):
+        """DI로 만든 질문 생성기는 question_max_tokens를 실제 LLM 요청에 포함"""
+        from app.core.config import get_settings
+        from app.presentation import dependencies
+
+        monkeypatch.setattr(dependencies, attr, None)
+        monkeypatch.setattr(dependencies, "get_http_client", lambda: None)
+
+        generator = getattr(dependencies, getter)()
+        payload = generator.llm._get_request_payload([("user", "질문")])
+
+        # langchain-openai 버전에 따라 max_completion_tokens 또는 max_tokens로 전송
+        sent = payload.get("max_completion_tokens", payload.get("max_tokens"))
+        assert sent == get_settings().question_max_tokens
+
+
+class TestParseJsonObject:
+    """LLM JSON 응답 파싱 테스트"""
+
+    def test_parse_plain_json(self):
+        from app.infrastructure.llm.json_response import parse_json_object
+
+        assert parse_json_object('{"question": "Q", "level": 2}') == {
+            "question": "Q",
+            "level": 2,
+        }
+
+    def test_parse_fenced_json(self):
+        """코드펜스로 감싼 응답도 파싱"""
+        from app.infrastructure.llm.json_response import parse_json_object
+
+        content = '```json\n{"question": "Q", "level": 3}\n```'
+
+        assert parse_json_object(content)["level"] == 3
+
+    def test_parse_invalid_raises_value_error(self):
+        from app.infrastructure.llm.json_response import parse_json_object
+
+        with pytest.raises(ValueError):
+            parse_json_object("JSON 아님")
+
+
+class TestOpenAIClient:
+    """OpenAIClient 임베딩 캐시 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        from app.adapters.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client._client = MagicMock()
+        client._client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[0.1] * 1536)])
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_create_embedding_cache_hit(self, client):
+        """동일 텍스트 재요청 시 OpenAI 호출 없이 캐시 반환"""
+        first = await client.create_embedding("같은 텍스트")
+        second = await client.create_embedding("같은 텍스트")
+
+        assert first.data[0].embedding == second.data[0].embedding
+        client._client.embeddings.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_embedding_shares_inflight_request(self, client):
+        """동일 텍스트 동시 요청 시 OpenAI 호출 1회 공유"""
+        first, second = await asyncio.gather(
+            client.create_embedding("동시 텍스트"),
+            client.create_embedding("동시 텍스트"),
+        )
+
+        assert first is second
+        client._client.embeddings.create.assert_called_once()
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_create_embedding_no_cache(self, client):
+        """no_cache=True면 매번 OpenAI 호출"""
+        await client.create_embedding("민감한 텍스트", no_cache=True)
+        await client.create_embedding("민감한 텍스트", no_cache=True)
+
+        assert client._client.embeddings.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_embeddings_batches_only_cache_misses(self, client):
+        """배치 임베딩 - 캐시 miss만 한 번의 요청으로 묶어 순서대로 반환"""
+        await client.create_embedding("A")
+        client._client.embeddings.create = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    MagicMock(index=0, embedding=[0.2] * 1536),
+                    MagicMock(index=1, embedding=[0.3] * 1536),
+                ]
+            )
+        )
+
+        embeddings = await client.create_embeddings(["B", "A", "C"])
+
+        assert [e[0] for e in embeddings] == [0.2, 0.1, 0.3]
+        client._client.embeddings.create.assert_called_once()
+        assert client._client.embeddings.create.call_args.kwargs["input"] == ["B", "C"]
+
 
 class TestPromptLoader:
     """PromptLoader 유틸리티 테스트"""
@@ -267,7 +1051,6 @@ class TestInfrastructureIntegration:
         )
 
         # Given: Mock Infrastructure
-        from app.domain.entities.qa_document import QADocument
         from app.domain.ports.question_generator_port import QuestionGeneratorPort
         from app.domain.ports.vector_store_port import VectorStorePort
         from app.domain.value_objects.question_level import QuestionLevel
@@ -275,21 +1058,12 @@ class TestInfrastructureIntegration:
         mock_vector_store = AsyncMock(spec=VectorStorePort)
         mock_vector_store.store.return_value = True
         mock_vector_store.search_by_member.return_value = []
-        mock_vector_store.search_similar_questions.return_value = 0.3  # 유사도 낮음
+        mock_vector_store.search_similar_questions_batch.return_value = [0.3]  # 유사도 낮음
         # role_label 조회용
-        mock_vector_store.get_recent_questions_by_member.return_value = [
-            QADocument(
-                family_id="family-1",
-                member_id="member-10",
-                role_label="첫째 딸",
-                question="이전 질문",
-                answer="이전 답변",
-                answered_at=datetime(2026, 1, 19, 10, 0, 0),
-            ),
-        ]
+        mock_vector_store.get_role_label_by_member.return_value = "첫째 딸"
 
         mock_generator = AsyncMock(spec=QuestionGeneratorPort)
-        mock_generator.generate_question.return_value = ("테스트 질문", QuestionLevel(2))
+        mock_generator.generate_questions.return_value = [("테스트 질문", QuestionLevel(2))]
 
         use_case = GeneratePersonalQuestionUseCase(
             vector_store=mock_vector_store,
@@ -315,4 +1089,4 @@ class TestInfrastructureIntegration:
         # Infrastructure 호출 검증
         mock_vector_store.store.assert_called_once()
         mock_vector_store.search_by_member.assert_called_once()
-        mock_generator.generate_question.assert_called_once()
+        mock_generator.generate_questions.assert_called_once()
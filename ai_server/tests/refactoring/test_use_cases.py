@@ -7,8 +7,9 @@ Clean Architecture 원칙:
 - 순수 비즈니스 로직만 포함
 """
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import ANY, AsyncMock
 
 import pytest
 
@@ -23,18 +24,12 @@ class TestGeneratePersonalQuestionUseCase:
 
         mock = AsyncMock()
         mock.store.return_value = True
-        mock.search_similar_questions.return_value = 0.3  # 유사도 낮음 (중복 아님)
+        # 유사도 낮음 (중복 아님)
+        mock.search_similar_questions_batch.side_effect = (
+            lambda question_texts, member_id, exclude=None: [0.3] * len(question_texts)
+        )
         # role_label 조회용
-        mock.get_recent_questions_by_member.return_value = [
-            QADocument(
-                family_id="family-1",
-                member_id="member-10",
-                role_label="첫째 딸",
-                question="이전 질문",
-                answer="이전 답변",
-                answered_at=datetime(2026, 1, 19, 10, 0, 0),
-            ),
-        ]
+        mock.get_role_label_by_member.return_value = "첫째 딸"
         mock.search_by_member.return_value = [
             QADocument(
                 family_id="family-1",
@@ -61,7 +56,7 @@ class TestGeneratePersonalQuestionUseCase:
         from app.domain.value_objects.question_level import QuestionLevel
 
         mock = AsyncMock()
-        mock.generate_question.return_value = ("친구들과 어떤 놀이를 했나요?", QuestionLevel(2))
+        mock.generate_questions.return_value = [("친구들과 어떤 놀이를 했나요?", QuestionLevel(2))]
         return mock
 
     @pytest.mark.asyncio
@@ -110,7 +105,7 @@ class TestGeneratePersonalQuestionUseCase:
 
         # Then: Mock 호출 검증 (순서: RAG → 생성 → 저장)
         mock_vector_store.search_by_member.assert_called_once()
-        mock_question_generator.generate_question.assert_called_once()
+        mock_question_generator.generate_questions.assert_called_once()
         mock_vector_store.store.assert_called_once()
 
         # Then: 검색 파라미터 검증
@@ -153,22 +148,191 @@ class TestGeneratePersonalQuestionUseCase:
         assert output.metadata["rag_count"] == 0
 
         # RAG 결과가 빈 리스트로 전달됨
-        generate_call = mock_question_generator.generate_question.call_args
+        generate_call = mock_question_generator.generate_questions.call_args
         assert generate_call.kwargs["rag_context"] == []
 
     @pytest.mark.asyncio
-    async def test_generate_personal_question_vector_store_failure_raises_error(
-        self, mock_vector_store, mock_question_generator
+    @pytest.mark.parametrize("store_result", [False, RuntimeError("chroma down")])
+    async def test_generate_personal_question_vector_store_failure_does_not_fail_request(
+        self, mock_vector_store, mock_question_generator, store_result, monkeypatch
     ):
-        """[RED] 벡터 스토어 저장 실패 시 예외 발생 (옵션 B)"""
+        """벡터 스토어 저장 실패(False/예외)는 백그라운드에서 재시도, 응답은 정상 반환"""
         # Given
+        if isinstance(store_result, Exception):
+            mock_vector_store.store.side_effect = store_result
+        else:
+            mock_vector_store.store.return_value = store_result
+
+        from app.application.use_cases.base import RAGQuestionUseCase
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core import background
+
+        monkeypatch.setattr(RAGQuestionUseCase, "STORE_RETRY_BASE_DELAY", 0)
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="테스트",
+            base_answer="테스트",
+            answered_at=datetime.now(),
+        )
+
+        # When: 저장 실패와 무관하게 질문 반환
+        output = await use_case.execute(input_dto)
+        await background.drain()
+
+        # Then: 응답 시점에는 저장 진행 중, 이후 최대 시도 횟수만큼 재시도
+        assert output.question == "친구들과 어떤 놀이를 했나요?"
+        assert output.metadata["store_status"] == "pending"
+        assert mock_vector_store.store.await_count == RAGQuestionUseCase.STORE_RETRY_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_generate_personal_question_store_retry_recovers(
+        self, mock_vector_store, mock_question_generator, monkeypatch
+    ):
+        """일시적 저장 실패는 재시도로 복구 (같은 base_qa로 다시 저장)"""
+        mock_vector_store.store.side_effect = [False, True]
+
+        from app.application.use_cases.base import RAGQuestionUseCase
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+
+        monkeypatch.setattr(RAGQuestionUseCase, "STORE_RETRY_BASE_DELAY", 0)
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="테스트",
+            base_answer="테스트",
+            answered_at=datetime.now(),
+        )
+        base_qa = use_case._create_base_qa(input_dto, "첫째 딸")
+
+        stored = await use_case._store_with_retry(mock_vector_store.store(base_qa), base_qa)
+
+        assert stored is True
+        assert mock_vector_store.store.await_count == 2
+        assert mock_vector_store.store.call_args_list[1].args == (base_qa,)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("attempts", [0, 1])
+    async def test_generate_personal_question_store_single_attempt(
+        self, mock_vector_store, mock_question_generator, monkeypatch, attempts
+    ):
+        """시도 횟수 0/1: 첫 시도만 기다리고 재시도 없이 실패 반환 (예외 없음)"""
         mock_vector_store.store.return_value = False
 
+        from app.application.use_cases.base import RAGQuestionUseCase
         from app.application.use_cases.generate_personal_question import (
             GeneratePersonalQuestionInput,
             GeneratePersonalQuestionUseCase,
         )
 
+        monkeypatch.setattr(RAGQuestionUseCase, "STORE_RETRY_ATTEMPTS", attempts)
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="테스트",
+            base_answer="테스트",
+            answered_at=datetime.now(),
+        )
+        base_qa = use_case._create_base_qa(input_dto, "첫째 딸")
+
+        stored = await use_case._store_with_retry(mock_vector_store.store(base_qa), base_qa)
+
+        assert stored is False
+        assert mock_vector_store.store.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_personal_question_store_starts_after_rag_search(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """저장은 RAG 검색이 끝난 뒤, 질문 생성 전에 시작 (base_qa가 자기 검색 결과에 섞이지 않음)"""
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core import background
+        from app.domain.value_objects.question_level import QuestionLevel
+
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="오늘 뭐 했어?",
+            base_answer="친구랑 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+        previous = mock_vector_store.search_by_member.return_value
+        store_started = {}
+
+        async def search_by_member(**kwargs):
+            await asyncio.sleep(0)
+            store_started["search"] = mock_vector_store.store.call_count
+            return previous
+
+        async def generate_questions(**kwargs):
+            await asyncio.sleep(0)
+            store_started["generate"] = mock_vector_store.store.call_count
+            return [("친구들과 어떤 놀이를 했나요?", QuestionLevel(2))]
+
+        mock_vector_store.search_by_member.side_effect = search_by_member
+        mock_question_generator.generate_questions.side_effect = generate_questions
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        output = await use_case.execute(input_dto)
+        await background.drain()
+
+        assert store_started == {"search": 0, "generate": 1}
+        assert output.metadata["rag_count"] == len(previous)
+
+    @pytest.mark.asyncio
+    async def test_generate_personal_question_generation_failure_keeps_store(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """질문 생성 실패 시 원래 예외(ValueError) 전파, 저장은 백그라운드에서 계속 진행"""
+        store_completed = asyncio.Event()
+
+        async def slow_store(doc):
+            await asyncio.sleep(0.01)
+            store_completed.set()
+            return True
+
+        mock_vector_store.store.side_effect = slow_store
+        mock_question_generator.generate_questions.side_effect = ValueError("LLM 응답 오류")
+
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core import background
+
         use_case = GeneratePersonalQuestionUseCase(
             vector_store=mock_vector_store,
             question_generator=mock_question_generator,
@@ -183,14 +347,13 @@ class TestGeneratePersonalQuestionUseCase:
             answered_at=datetime.now(),
         )
 
-        # When/Then: 저장 실패 시 예외 발생
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(ValueError):
             await use_case.execute(input_dto)
 
-        assert "저장 실패" in str(exc_info.value)
-
-        # 질문 생성은 호출됨 (저장 전에 실행되므로)
-        mock_question_generator.generate_question.assert_called_once()
+        # 응답은 저장을 기다리지 않고, 저장은 drain 시점까지 완료됨
+        assert not store_completed.is_set()
+        await background.drain()
+        assert store_completed.is_set()
 
 
 class TestGenerateFamilyQuestionUseCase:
@@ -203,18 +366,12 @@ class TestGenerateFamilyQuestionUseCase:
 
         mock = AsyncMock()
         mock.store.return_value = True
-        mock.search_similar_questions.return_value = 0.3  # 유사도 낮음 (중복 아님)
+        # 유사도 낮음 (중복 아님)
+        mock.search_similar_questions_batch.side_effect = (
+            lambda question_texts, member_id, exclude=None: [0.3] * len(question_texts)
+        )
         # role_label 조회용
-        mock.get_recent_questions_by_member.return_value = [
-            QADocument(
-                family_id="family-1",
-                member_id="member-10",
-                role_label="첫째 딸",
-                question="이전 질문",
-                answer="이전 답변",
-                answered_at=datetime(2026, 1, 19, 10, 0, 0),
-            ),
-        ]
+        mock.get_role_label_by_member.return_value = "첫째 딸"
         mock.search_by_family.return_value = [
             QADocument(
                 family_id="family-1",
@@ -241,10 +398,9 @@ class TestGenerateFamilyQuestionUseCase:
         from app.domain.value_objects.question_level import QuestionLevel
 
         mock = AsyncMock()
-        mock.generate_question.return_value = (
-            "가족들이 좋아하는 저녁 메뉴는 무엇인가요?",
-            QuestionLevel(3),
-        )
+        mock.generate_questions.return_value = [
+            ("가족들이 좋아하는 저녁 메뉴는 무엇인가요?", QuestionLevel(3))
+        ]
         return mock
 
     @pytest.mark.asyncio
@@ -281,7 +437,7 @@ class TestGenerateFamilyQuestionUseCase:
 
         # Then: Mock 호출 검증 (순서: RAG → 생성 → 저장)
         mock_vector_store.search_by_family.assert_called_once()
-        mock_question_generator.generate_question.assert_called_once()
+        mock_question_generator.generate_questions.assert_called_once()
         mock_vector_store.store.assert_called_once()
 
         # Then: 검색 파라미터 검증 (top_k=10)
@@ -289,6 +445,148 @@ class TestGenerateFamilyQuestionUseCase:
         assert search_call.kwargs["family_id"] == "family-1"
         assert search_call.kwargs["top_k"] == 10
 
+    @pytest.mark.asyncio
+    async def test_generate_family_question_skips_search_for_empty_family(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """저장된 문서가 없는 가족은 RAG 검색(임베딩 포함) 생략"""
+        from app.application.use_cases.generate_family_question import (
+            GenerateFamilyQuestionInput,
+            GenerateFamilyQuestionUseCase,
+        )
+
+        mock_vector_store.family_has_docs.return_value = False
+
+        use_case = GenerateFamilyQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        input_dto = GenerateFamilyQuestionInput(
+            family_id="family-new",
+            member_id="member-10",
+            base_question="오늘 저녁 뭐 먹을까?",
+            base_answer="치킨 먹고 싶어요",
+            answered_at=datetime(2026, 1, 20, 18, 0, 0),
+        )
+
+        output = await use_case.execute(input_dto)
+
+        assert output.metadata["rag_count"] == 0
+        mock_vector_store.search_by_family.assert_not_called()
+        mock_vector_store.store.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_family_question_overlaps_role_label_and_family_check(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """role_label 조회와 가족 문서 확인은 동시에 진행 (순차 실행이면 서로 기다리다 타임아웃)"""
+        from app.application.use_cases.generate_family_question import (
+            GenerateFamilyQuestionInput,
+            GenerateFamilyQuestionUseCase,
+        )
+
+        role_started = asyncio.Event()
+        family_started = asyncio.Event()
+
+        async def get_role_label_by_member(member_id):
+            role_started.set()
+            await family_started.wait()
+            return "첫째 딸"
+
+        async def family_has_docs(family_id):
+            family_started.set()
+            await role_started.wait()
+            return True
+
+        mock_vector_store.get_role_label_by_member.side_effect = get_role_label_by_member
+        mock_vector_store.family_has_docs.side_effect = family_has_docs
+
+        use_case = GenerateFamilyQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        input_dto = GenerateFamilyQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            base_question="오늘 저녁 뭐 먹을까?",
+            base_answer="치킨 먹고 싶어요",
+            answered_at=datetime(2026, 1, 20, 18, 0, 0),
+        )
+
+        output = await asyncio.wait_for(use_case.execute(input_dto), timeout=1)
+
+        assert output.metadata["rag_count"] == 2
+        search_call = mock_vector_store.search_by_family.call_args
+        assert search_call.kwargs["query_doc"].role_label == "첫째 딸"
+
+    @pytest.mark.asyncio
+    async def test_generate_family_question_uses_looked_up_role_label(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """role_label 미전달 시 RAG 검색 전에 조회한 role_label로 검색/생성/저장"""
+        from app.application.use_cases.generate_family_question import (
+            GenerateFamilyQuestionInput,
+            GenerateFamilyQuestionUseCase,
+        )
+
+        use_case = GenerateFamilyQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        input_dto = GenerateFamilyQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            base_question="오늘 저녁 뭐 먹을까?",
+            base_answer="치킨 먹고 싶어요",
+            answered_at=datetime(2026, 1, 20, 18, 0, 0),
+        )
+
+        await use_case.execute(input_dto)
+
+        stored_qa = mock_vector_store.store.call_args.args[0]
+        assert stored_qa.role_label == "첫째 딸"
+        generate_call = mock_question_generator.generate_questions.call_args
+        assert generate_call.kwargs["base_qa"].role_label == "첫째 딸"
+        search_call = mock_vector_store.search_by_family.call_args
+        assert search_call.kwargs["query_doc"].role_label == "첫째 딸"
+        mock_vector_store.get_role_label_by_member.assert_called_once_with(member_id="member-10")
+
+    @pytest.mark.asyncio
+    async def test_generate_family_question_role_label_default_fallback(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """조회 결과가 없으면 기본 role_label로 검색/저장"""
+        from app.application.use_cases.base import DEFAULT_ROLE_LABEL
+        from app.application.use_cases.generate_family_question import (
+            GenerateFamilyQuestionInput,
+            GenerateFamilyQuestionUseCase,
+        )
+
+        mock_vector_store.get_role_label_by_member.return_value = None
+
+        use_case = GenerateFamilyQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+        )
+
+        input_dto = GenerateFamilyQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            base_question="오늘 저녁 뭐 먹을까?",
+            base_answer="치킨 먹고 싶어요",
+            answered_at=datetime(2026, 1, 20, 18, 0, 0),
+        )
+
+        await use_case.execute(input_dto)
+
+        search_call = mock_vector_store.search_by_family.call_args
+        assert search_call.kwargs["query_doc"].role_label == DEFAULT_ROLE_LABEL
+        stored_qa = mock_vector_store.store.call_args.args[0]
+        assert stored_qa.role_label == DEFAULT_ROLE_LABEL
+
 
 class TestDuplicateQuestionCheck:
     """중복 질문 체크 테스트"""
@@ -318,28 +616,31 @@ class TestDuplicateQuestionCheck:
         from app.domain.value_objects.question_level import QuestionLevel
 
         mock = AsyncMock()
-        mock.generate_question.return_value = ("새로운 질문입니다", QuestionLevel(2))
+        mock.generate_questions.return_value = [("새로운 질문입니다", QuestionLevel(2))]
         return mock
 
     @pytest.mark.asyncio
     async def test_regenerate_when_similarity_over_threshold(
         self, mock_vector_store, mock_question_generator
     ):
-        """[RED] 유사도 0.9 이상이면 재생성"""
+        """[RED] 유사도 임계값(0.95) 이상이면 재생성"""
         from app.application.use_cases.generate_personal_question import (
             GeneratePersonalQuestionInput,
             GeneratePersonalQuestionUseCase,
         )
         from app.domain.value_objects.question_level import QuestionLevel
 
-        # Given: 첫 번째 질문은 유사도 높음, 두 번째는 OK
-        mock_question_generator.generate_question.side_effect = [
+        # Given: 첫 번째 후보는 유사도 높음, 두 번째는 OK
+        mock_question_generator.generate_questions.return_value = [
             ("오늘 학교 어땠어?", QuestionLevel(2)),  # 중복 (기존 질문과 동일)
             ("새로운 친구 사귀었어?", QuestionLevel(2)),  # 고유
+            ("주말에 뭐 하고 싶어?", QuestionLevel(2)),  # 고유 (사용 안 됨)
         ]
-        mock_vector_store.search_similar_questions.side_effect = [
-            0.95,  # 첫 번째: 유사도 높음 → 재생성
+        mock_vector_store.search_similar_questions_batch.side_effect = None
+        mock_vector_store.search_similar_questions_batch.return_value = [
+            0.95,  # 첫 번째: 유사도 높음 → 건너뜀
             0.30,  # 두 번째: 유사도 낮음 → OK
+            0.20,
         ]
 
         use_case = GeneratePersonalQuestionUseCase(
@@ -359,9 +660,18 @@ class TestDuplicateQuestionCheck:
         # When
         output = await use_case.execute(input_dto)
 
-        # Then: 재생성 후 고유 질문 반환
+        # Then: 후보는 한 번에 생성/유사도 체크, 첫 번째 고유 질문 반환
         assert output.question == "새로운 친구 사귀었어?"
-        assert mock_question_generator.generate_question.call_count == 2
+        assert mock_question_generator.generate_questions.call_count == 1
+        assert mock_question_generator.generate_questions.call_args.kwargs["n"] == 3
+        mock_vector_store.search_similar_questions_batch.assert_called_once_with(
+            question_texts=["오늘 학교 어땠어?", "새로운 친구 사귀었어?", "주말에 뭐 하고 싶어?"],
+            member_id="member-10",
+            exclude=ANY,
+        )
+        # 백그라운드로 저장 중인 base_qa는 중복 비교에서 제외
+        excluded = mock_vector_store.search_similar_questions_batch.call_args.kwargs["exclude"]
+        assert (excluded.question, excluded.answer) == ("오늘 뭐 했어?", "친구랑 놀았어요")
         assert output.metadata["regeneration_count"] == 1
 
     @pytest.mark.asyncio
@@ -373,12 +683,14 @@ class TestDuplicateQuestionCheck:
         )
         from app.domain.value_objects.question_level import QuestionLevel
 
-        # Given: 모든 질문이 유사함
-        mock_question_generator.generate_question.return_value = (
-            "계속 유사한 질문",
-            QuestionLevel(2),
-        )
-        mock_vector_store.search_similar_questions.return_value = 0.95  # 항상 유사
+        # Given: 모든 후보가 유사함
+        mock_question_generator.generate_questions.return_value = [
+            ("유사한 질문 1", QuestionLevel(2)),
+            ("유사한 질문 2", QuestionLevel(2)),
+            ("계속 유사한 질문", QuestionLevel(2)),
+        ]
+        mock_vector_store.search_similar_questions_batch.side_effect = None
+        mock_vector_store.search_similar_questions_batch.return_value = [0.95] * 3  # 항상 유사
 
         use_case = GeneratePersonalQuestionUseCase(
             vector_store=mock_vector_store,
@@ -397,8 +709,8 @@ class TestDuplicateQuestionCheck:
         # When
         output = await use_case.execute(input_dto)
 
-        # Then: 3번 시도 후 마지막 질문 반환
-        assert mock_question_generator.generate_question.call_count == 3
+        # Then: 후보 3개 모두 중복 → 마지막 질문 반환
+        assert mock_question_generator.generate_questions.call_args.kwargs["n"] == 3
         assert output.question == "계속 유사한 질문"
         assert output.metadata["regeneration_count"] == 2
         assert output.metadata["similarity_warning"] is True
@@ -412,7 +724,8 @@ class TestDuplicateQuestionCheck:
         )
 
         # Given: 유사도 낮음
-        mock_vector_store.search_similar_questions.return_value = 0.30
+        mock_vector_store.search_similar_questions_batch.side_effect = None
+        mock_vector_store.search_similar_questions_batch.return_value = [0.30]
 
         use_case = GeneratePersonalQuestionUseCase(
             vector_store=mock_vector_store,
@@ -432,9 +745,91 @@ class TestDuplicateQuestionCheck:
         output = await use_case.execute(input_dto)
 
         # Then: 1번만 호출
-        assert mock_question_generator.generate_question.call_count == 1
+        assert mock_question_generator.generate_questions.call_count == 1
         assert output.metadata["regeneration_count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_asked_question_prefilter_skips_vector_search(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """이미 받은 질문(base_qa/RAG 결과)과 정확히 같은 후보는 벡터 검색 없이 중복 처리"""
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core.cache import LRUCache
+        from app.domain.value_objects.question_level import QuestionLevel
+
+        mock_question_generator.generate_questions.return_value = [
+            ("오늘 뭐 했어", QuestionLevel(2)),  # base_question과 문장부호만 다름
+            ("오늘 학교 어땠어 ?", QuestionLevel(2)),  # RAG 결과 질문과 공백만 다름
+            ("새로운 친구 사귀었어?", QuestionLevel(2)),
+        ]
+        mock_vector_store.search_similar_questions_batch.side_effect = None
+        mock_vector_store.search_similar_questions_batch.return_value = [0.30]
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+            asked_questions=LRUCache(max_size=10),
+        )
+
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="오늘 뭐 했어?",
+            base_answer="친구랑 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        output = await use_case.execute(input_dto)
+
+        assert output.question == "새로운 친구 사귀었어?"
+        assert output.metadata["regeneration_count"] == 2
+        mock_vector_store.search_similar_questions_batch.assert_called_once_with(
+            question_texts=["새로운 친구 사귀었어?"],
+            member_id="member-10",
+            exclude=ANY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_asked_question_prefilter_all_hits_skip_search(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """모든 후보가 이미 받은 질문이면 벡터 검색 없이 마지막 후보 + 경고"""
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core.cache import LRUCache
+        from app.domain.value_objects.question_level import QuestionLevel
+
+        mock_question_generator.generate_questions.return_value = [
+            ("오늘 뭐 했어?", QuestionLevel(2)),
+        ]
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+            asked_questions=LRUCache(max_size=10),
+        )
+
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="오늘 뭐 했어?",
+            base_answer="친구랑 놀았어요",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        output = await use_case.execute(input_dto)
+
+        assert output.question == "오늘 뭐 했어?"
+        assert output.metadata["similarity_warning"] is True
+        mock_vector_store.search_similar_questions_batch.assert_not_called()
+
 
 class TestFamilyRecentQuestionUseCase:
     """가족 최근 질문 기반 Use Case 테스트 (신규 API)"""
@@ -445,7 +840,10 @@ class TestFamilyRecentQuestionUseCase:
         from app.domain.entities.qa_document import QADocument
 
         mock = AsyncMock()
-        mock.search_similar_questions.return_value = 0.3  # 유사도 낮음
+        # 유사도 낮음
+        mock.search_similar_questions_batch.side_effect = (
+            lambda question_texts, member_id, exclude=None: [0.3] * len(question_texts)
+        )
 
         # 가족 전체 최근 질문 반환
         mock.get_recent_questions_by_family.return_value = [
@@ -482,10 +880,9 @@ class TestFamilyRecentQuestionUseCase:
         from app.domain.value_objects.question_level import QuestionLevel
 
         mock = AsyncMock()
-        mock.generate_question_for_target.return_value = (
-            "아빠, 요즘 회사에서 어떤 프로젝트 하고 계세요?",
-            QuestionLevel(3),
-        )
+        mock.generate_questions_for_target.return_value = [
+            ("아빠, 요즘 회사에서 어떤 프로젝트 하고 계세요?", QuestionLevel(3))
+        ]
         return mock
 
     @pytest.mark.asyncio
@@ -525,7 +922,7 @@ class TestFamilyRecentQuestionUseCase:
         )
 
         # Then: 질문 생성 확인
-        mock_question_generator.generate_question_for_target.assert_called_once()
+        mock_question_generator.generate_questions_for_target.assert_called_once()
 
         # Then: 저장 안 함 확인
         mock_vector_store.store.assert_not_called()
@@ -541,12 +938,13 @@ class TestFamilyRecentQuestionUseCase:
         )
         from app.domain.value_objects.question_level import QuestionLevel
 
-        # Given: 첫 번째 질문은 유사도 높음
-        mock_question_generator.generate_question_for_target.side_effect = [
+        # Given: 첫 번째 후보는 유사도 높음
+        mock_question_generator.generate_questions_for_target.return_value = [
             ("중복 질문입니다", QuestionLevel(2)),
             ("새로운 질문입니다", QuestionLevel(3)),
         ]
-        mock_vector_store.search_similar_questions.side_effect = [0.95, 0.30]
+        mock_vector_store.search_similar_questions_batch.side_effect = None
+        mock_vector_store.search_similar_questions_batch.return_value = [0.95, 0.30]
 
         use_case = FamilyRecentQuestionUseCase(
             vector_store=mock_vector_store,
@@ -563,7 +961,7 @@ class TestFamilyRecentQuestionUseCase:
 
         # Then
         assert output.question == "새로운 질문입니다"
-        assert mock_question_generator.generate_question_for_target.call_count == 2
+        assert mock_question_generator.generate_questions_for_target.call_count == 1
         assert output.metadata["regeneration_count"] == 1
 
     @pytest.mark.asyncio
@@ -577,7 +975,9 @@ class TestFamilyRecentQuestionUseCase:
         # Given: 가족의 최근 질문이 없음 (새로운 mock 생성)
         empty_vector_store = AsyncMock()
         empty_vector_store.get_recent_questions_by_family.return_value = []
-        empty_vector_store.search_similar_questions.return_value = 0.3
+        empty_vector_store.search_similar_questions_batch.side_effect = (
+            lambda question_texts, member_id, exclude=None: [0.3] * len(question_texts)
+        )
 
         use_case = FamilyRecentQuestionUseCase(
             vector_store=empty_vector_store,
@@ -596,6 +996,60 @@ class TestFamilyRecentQuestionUseCase:
         assert output.question is not None
         assert output.metadata["context_count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_family_recent_question_candidate_cache(
+        self, mock_vector_store, mock_question_generator
+    ):
+        """같은 입력/컨텍스트 재요청 시 후보 캐시 1회 재사용 (이전 선택 질문 제외), 이후 재생성"""
+        from app.application.dto.question_dto import FamilyRecentQuestionInput
+        from app.application.use_cases.family_recent_question import (
+            FamilyRecentQuestionUseCase,
+        )
+        from app.core.cache import LRUCache
+        from app.domain.entities.qa_document import QADocument
+        from app.domain.value_objects.question_level import QuestionLevel
+
+        mock_question_generator.generate_questions_for_target.return_value = [
+            ("첫 번째 후보", QuestionLevel(2)),
+            ("두 번째 후보", QuestionLevel(2)),
+        ]
+        use_case = FamilyRecentQuestionUseCase(
+            vector_store=mock_vector_store,
+            question_generator=mock_question_generator,
+            candidate_cache=LRUCache(max_size=10),
+            asked_questions=LRUCache(max_size=10),
+        )
+        input_dto = FamilyRecentQuestionInput(family_id="family-1", member_id="member-1")
+
+        first = await use_case.execute(input_dto)
+        second = await use_case.execute(input_dto)
+
+        # 캐시 재사용 시 이미 받은 첫 번째 후보는 건너뜀
+        assert (first.question, second.question) == ("첫 번째 후보", "두 번째 후보")
+        assert mock_question_generator.generate_questions_for_target.call_count == 1
+        # 캐시된 후보도 유사도 체크는 매번 수행
+        assert mock_vector_store.search_similar_questions_batch.call_count == 2
+
+        # 재사용된 항목은 제거되어 같은 입력이라도 다시 생성
+        await use_case.execute(input_dto)
+        assert mock_question_generator.generate_questions_for_target.call_count == 2
+
+        # 새 QA가 저장되어 컨텍스트가 바뀌면 캐시 미스
+        mock_vector_store.get_recent_questions_by_family.return_value = [
+            *mock_vector_store.get_recent_questions_by_family.return_value,
+            QADocument(
+                family_id="family-1",
+                member_id="member-1",
+                role_label="아빠",
+                question="주말에 뭐 해?",
+                answer="등산",
+                answered_at=datetime(2026, 1, 20, 9, 0, 0),
+            ),
+        ]
+        await use_case.execute(input_dto)
+
+        assert mock_question_generator.generate_questions_for_target.call_count == 3
+
 
 class TestUseCaseDTO:
     """Use Case DTO 테스트"""
@@ -632,3 +1086,135 @@ class TestUseCaseDTO:
         assert output_dto.question == "테스트 질문"
         assert output_dto.level.value == 2
         assert output_dto.metadata["rag_count"] == 5
+
+
+class TestFamilySummaryUseCase:
+    """가족 요약 Use Case 캐시 테스트"""
+
+    @pytest.fixture
+    def docs(self):
+        from app.domain.entities.qa_document import QADocument
+
+        return [
+            QADocument(
+                family_id="family-1",
+                member_id="member-10",
+                role_label="첫째 딸",
+                question="오늘 학교 어땠어?",
+                answer="재미있었어요!",
+                answered_at=datetime(2026, 1, 15, 10, 0, 0),
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_same_qa_set_reuses_cached_summary(self, docs):
+        """기간 내 QA 구성이 같으면 LLM을 다시 호출하지 않음, 바뀌면 새로 생성"""
+        from app.application.dto.summary_dto import SummaryInput
+        from app.application.use_cases.family_summary import FamilySummaryUseCase
+        from app.core.cache import LRUCache
+        from app.domain.entities.qa_document import QADocument
+
+        vector_store = AsyncMock()
+        vector_store.get_qa_by_family_in_range.return_value = docs
+        summary_generator = AsyncMock()
+        summary_generator.generate_summary.side_effect = ["요약 1", "요약 2"]
+        use_case = FamilySummaryUseCase(
+            vector_store=vector_store,
+            summary_generator=summary_generator,
+            summary_cache=LRUCache(max_size=8, ttl=60),
+        )
+        input_dto = SummaryInput(family_id="family-1", period="weekly")
+
+        first = await use_case.execute(input_dto)
+        second = await use_case.execute(input_dto)
+
+        assert first.context == second.context == "요약 1"
+        assert summary_generator.generate_summary.await_count == 1
+        # QA 텍스트는 목록이 아닌 1회 순회용 제너레이터로 전달
+        qa_texts = summary_generator.generate_summary.call_args.kwargs["qa_texts"]
+        assert not isinstance(qa_texts, list)
+        assert list(qa_texts) == [docs[0].to_embedding_text()]
+
+        vector_store.get_qa_by_family_in_range.return_value = [
+            *docs,
+            QADocument(
+                family_id="family-1",
+                member_id="member-11",
+                role_label="아빠",
+                question="주말에 뭐 할까?",
+                answer="캠핑 가자",
+                answered_at=datetime(2026, 1, 16, 9, 0, 0),
+            ),
+        ]
+        third = await use_case.execute(input_dto)
+
+        assert third.context == "요약 2"
+        assert summary_generator.generate_summary.await_count == 2
+
+
+class TestLegacyUseCaseAliases:
+    """하위 호환 모듈(generate_*_question)은 RAG 구현의 re-export만 제공"""
+
+    def test_legacy_modules_reexport_rag_use_cases(self):
+        """레거시 이름은 별도 구현 없이 RAG Use Case와 동일한 클래스"""
+        from app.application.use_cases.family_rag_question import FamilyRAGQuestionUseCase
+        from app.application.use_cases.generate_family_question import (
+            GenerateFamilyQuestionUseCase,
+        )
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.application.use_cases.personal_rag_question import PersonalRAGQuestionUseCase
+
+        assert GeneratePersonalQuestionUseCase is PersonalRAGQuestionUseCase
+        assert GenerateFamilyQuestionUseCase is FamilyRAGQuestionUseCase
+
+    @pytest.mark.asyncio
+    async def test_rag_flow_order(self):
+        """플로우 고정: RAG 검색 → 질문 생성 → 중복 체크, 저장은 백그라운드에서 1회"""
+        from app.application.use_cases.generate_personal_question import (
+            GeneratePersonalQuestionInput,
+            GeneratePersonalQuestionUseCase,
+        )
+        from app.core import background
+        from app.domain.value_objects.question_level import QuestionLevel
+
+        calls = []
+
+        def record(name, result):
+            async def _side_effect(*args, **kwargs):
+                calls.append(name)
+                return result(*args, **kwargs) if callable(result) else result
+
+            return _side_effect
+
+        vector_store = AsyncMock()
+        vector_store.store.side_effect = record("store", True)
+        vector_store.search_by_member.side_effect = record("search", [])
+        vector_store.search_similar_questions_batch.side_effect = record(
+            "similarity",
+            lambda question_texts, member_id, exclude=None: [0.3] * len(question_texts),
+        )
+        question_generator = AsyncMock()
+        question_generator.generate_questions.side_effect = record(
+            "generate", [("새 질문", QuestionLevel(2))]
+        )
+
+        use_case = GeneratePersonalQuestionUseCase(
+            vector_store=vector_store,
+            question_generator=question_generator,
+        )
+        input_dto = GeneratePersonalQuestionInput(
+            family_id="family-1",
+            member_id="member-10",
+            role_label="첫째 딸",
+            base_question="테스트",
+            base_answer="테스트",
+            answered_at=datetime(2026, 1, 20, 14, 30, 0),
+        )
+
+        await use_case.execute(input_dto)
+        await background.drain()
+
+        assert [name for name in calls if name != "store"] == ["search", "generate", "similarity"]
+        assert calls.count("store") == 1